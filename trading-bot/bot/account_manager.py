@@ -374,16 +374,21 @@ class FillReconciler:
             # Calculate quantity delta (positive for buy, negative for sell)
             quantity_delta = fill.quantity if fill.side == "buy" else -fill.quantity
 
-            # Get current position
-            query = "SELECT quantity, avg_entry_price FROM positions WHERE symbol = ?"
+            # Get current position, including the realized P&L carried forward
+            query = (
+                "SELECT quantity, avg_entry_price, realized_pnl"
+                " FROM positions WHERE symbol = ?"
+            )
             result = await db_manager.fetch_one(query, (fill.symbol,))
 
             if result:
                 current_qty = Decimal(str(result["quantity"]))
                 current_avg_price = Decimal(str(result["avg_entry_price"]))
+                current_realized = Decimal(str(result["realized_pnl"]))
             else:
                 current_qty = Decimal("0")
                 current_avg_price = Decimal("0")
+                current_realized = Decimal("0")
 
             # Calculate new position
             new_qty = current_qty + quantity_delta
@@ -422,17 +427,6 @@ class FillReconciler:
             ) VALUES (?, ?, ?, ?, ?)
             """
 
-            current_realized = Decimal("0")
-            if result:
-                current_realized_result = await db_manager.fetch_one(
-                    "SELECT realized_pnl FROM positions WHERE symbol = ?",
-                    (fill.symbol,),
-                )
-                if current_realized_result:
-                    current_realized = Decimal(
-                        str(current_realized_result["realized_pnl"])
-                    )
-
             async with db_manager.get_connection() as conn:
                 await conn.execute(
                     upsert_query,
@@ -750,6 +744,9 @@ class AccountManager:
 
             # Register message handlers
             self.account_ws.add_account_callback(self._handle_account_update)
+            self.account_ws.add_account_callback(
+                self.deltadefi_client.on_account_update
+            )
 
             await self.account_ws.start()
 
@@ -22,7 +22,7 @@ class AssetBalance:
     asset: str
     quantity: float
     value_usd: float  # USD equivalent value
-    timestamp: float
+    timestamp: float  # time.monotonic() at update, only used for ages
 
 
 @dataclass
@@ -36,19 +36,44 @@ class RatioAdjustment:
     imbalance_ratio: float  # current_ratio / target_ratio
 
 
+@dataclass(slots=True)
+class BalanceStatus:
+    """Per-asset balance snapshot reported by get_status"""
+
+    quantity: float
+    value_usd: float
+    age_ms: float
+
+
+@dataclass(slots=True)
+class AssetRatioStatus:
+    """Asset ratio manager status snapshot"""
+
+    balances: dict[str, BalanceStatus]
+    current_ratio: float | None
+    target_ratio: float
+    is_within_tolerance: bool
+    imbalance_ratio: float
+    adjustments: RatioAdjustment
+    bid_allocation: float
+    ask_allocation: float
+
+
 class AssetRatioManager:
     """
     Manages asset ratio balancing and calculates adjustment factors
     for spread and liquidity based on USDM:ADA ratio deviations.
     """
 
-    def __init__(self):
+    def __init__(self) -> None:
         self.balances: dict[str, AssetBalance] = {}
         self.last_adjustment_time = 0.0
 
-    async def update_balance(self, asset: str, quantity: float, price_usd: float):
+    async def update_balance(
+        self, asset: str, quantity: float, price_usd: float
+    ) -> None:
         """Update asset balance information"""
-        current_time = time.time()
+        current_time = time.monotonic()
         value_usd = quantity * price_usd
 
         self.balances[asset] = AssetBalance(
@@ -92,8 +117,9 @@ class AssetRatioManager:
         if current_ratio is None:
             return False, None
 
-        target_ratio = settings.trading.target_asset_ratio
-        tolerance = settings.trading.ratio_tolerance
+        trading = settings.trading
+        target_ratio = trading.target_asset_ratio
+        tolerance = trading.ratio_tolerance
 
         deviation = abs(current_ratio - target_ratio) / target_ratio
         is_within = deviation <= tolerance
@@ -108,8 +134,10 @@ class AssetRatioManager:
             RatioAdjustment with multipliers for spreads and liquidity
         """
         current_ratio = self.get_current_ratio()
-        if current_ratio is None:
-            # No data available, return neutral adjustments
+        trading = settings.trading
+        target_ratio = trading.target_asset_ratio
+        if current_ratio is None or target_ratio <= 0:
+            # No data available (or no usable target), return neutral adjustments
             return RatioAdjustment(
                 bid_spread_multiplier=1.0,
                 ask_spread_multiplier=1.0,
@@ -118,38 +146,34 @@ class AssetRatioManager:
                 imbalance_ratio=1.0,
             )
 
-        target_ratio = settings.trading.target_asset_ratio
         imbalance_ratio = current_ratio / target_ratio
 
         # Calculate adjustment factors
-        spread_factor = settings.trading.spread_adjustment_factor
-        liquidity_factor = settings.trading.liquidity_adjustment_factor
-
-        if imbalance_ratio > 1.0:
-            # Excess USDM scenario (USDM > ADA)
-            # Need to buy more ADA, sell less ADA
-            excess_factor = imbalance_ratio - 1.0
-
-            # Bid orders (buying ADA): tighter spreads, more liquidity
-            bid_spread_multiplier = max(0.1, 1.0 - excess_factor * spread_factor)
-            bid_liquidity_multiplier = 1.0 + excess_factor * liquidity_factor
-
-            # Ask orders (selling ADA): wider spreads, less liquidity
-            ask_spread_multiplier = 1.0 + excess_factor * spread_factor
-            ask_liquidity_multiplier = max(0.1, 1.0 - excess_factor * liquidity_factor)
-
-        else:
-            # Excess ADA scenario (ADA > USDM)
-            # Need to sell more ADA, buy less ADA
-            deficit_factor = 1.0 - imbalance_ratio
-
-            # Ask orders (selling ADA): tighter spreads, more liquidity
-            ask_spread_multiplier = max(0.1, 1.0 - deficit_factor * spread_factor)
-            ask_liquidity_multiplier = 1.0 + deficit_factor * liquidity_factor
+        spread_factor = trading.spread_adjustment_factor
+        liquidity_factor = trading.liquidity_adjustment_factor
+
+        # Excess USDM (imbalance > 1): buy more ADA, sell less ADA
+        # Excess ADA (imbalance < 1): sell more ADA, buy less ADA
+        # At most one of these is non-zero, so each multiplier collapses to a
+        # single closed-form expression instead of two branches.
+        excess_factor = max(0.0, imbalance_ratio - 1.0)
+        deficit_factor = max(0.0, 1.0 - imbalance_ratio)
+
+        # Bid orders (buying ADA): tighter/larger on excess, wider/smaller on deficit
+        bid_spread_multiplier = max(0.1, 1.0 - excess_factor * spread_factor) * (
+            1.0 + deficit_factor * spread_factor
+        )
+        bid_liquidity_multiplier = (1.0 + excess_factor * liquidity_factor) * max(
+            0.1, 1.0 - deficit_factor * liquidity_factor
+        )
 
-            # Bid orders (buying ADA): wider spreads, less liquidity
-            bid_spread_multiplier = 1.0 + deficit_factor * spread_factor
-            bid_liquidity_multiplier = max(0.1, 1.0 - deficit_factor * liquidity_factor)
+        # Ask orders (selling ADA): tighter/larger on deficit, wider/smaller on excess
+        ask_spread_multiplier = max(0.1, 1.0 - deficit_factor * spread_factor) * (
+            1.0 + excess_factor * spread_factor
+        )
+        ask_liquidity_multiplier = (1.0 + deficit_factor * liquidity_factor) * max(
+            0.1, 1.0 - excess_factor * liquidity_factor
+        )
 
         adjustment = RatioAdjustment(
             bid_spread_multiplier=bid_spread_multiplier,
@@ -160,7 +184,7 @@ class AssetRatioManager:
         )
 
         # Log the adjustment if it's significant
-        if abs(imbalance_ratio - 1.0) > settings.trading.ratio_tolerance:
+        if abs(imbalance_ratio - 1.0) > trading.ratio_tolerance:
             logger.info(
                 "Asset ratio imbalance detected",
                 current_ratio=current_ratio,
@@ -201,34 +225,28 @@ class AssetRatioManager:
 
         return bid_allocation, ask_allocation
 
-    def get_status(self) -> dict[str, any]:
+    def get_status(self) -> AssetRatioStatus:
         """Get current asset ratio manager status"""
         current_ratio = self.get_current_ratio()
         is_within_tolerance, _ = self.is_ratio_within_tolerance()
         adjustment = self.get_ratio_adjustment()
         bid_alloc, ask_alloc = self.get_capital_allocation()
-
-        return {
-            "balances": {
-                asset: {
-                    "quantity": balance.quantity,
-                    "value_usd": balance.value_usd,
-                    "age_ms": (time.time() - balance.timestamp) * 1000,
-                }
+        now = time.monotonic()
+
+        return AssetRatioStatus(
+            balances={
+                asset: BalanceStatus(
+                    quantity=balance.quantity,
+                    value_usd=balance.value_usd,
+                    age_ms=(now - balance.timestamp) * 1000,
+                )
                 for asset, balance in self.balances.items()
             },
-            "current_ratio": current_ratio,
-            "target_ratio": settings.trading.target_asset_ratio,
-            "is_within_tolerance": is_within_tolerance,
-            "imbalance_ratio": adjustment.imbalance_ratio,
-            "adjustments": {
-                "bid_spread_multiplier": adjustment.bid_spread_multiplier,
-                "ask_spread_multiplier": adjustment.ask_spread_multiplier,
-                "bid_liquidity_multiplier": adjustment.bid_liquidity_multiplier,
-                "ask_liquidity_multiplier": adjustment.ask_liquidity_multiplier,
-            },
-            "capital_allocation": {
-                "bid_percentage": bid_alloc,
-                "ask_percentage": ask_alloc,
-            },
-        }
+            current_ratio=current_ratio,
+            target_ratio=settings.trading.target_asset_ratio,
+            is_within_tolerance=is_within_tolerance,
+            imbalance_ratio=adjustment.imbalance_ratio,
+            adjustments=adjustment,
+            bid_allocation=bid_alloc,
+            ask_allocation=ask_alloc,
+        )
@@ -3,35 +3,47 @@ Binance WebSocket client for book ticker streams using sidan-binance-py
 """
 
 import asyncio
+from collections import deque
+from contextlib import AbstractContextManager, nullcontext
 import json
 import time
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from binance.websocket.spot.websocket_stream import SpotWebsocketStreamClient
 import structlog
 
 from .order_manager import OrderManager
 
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
 logger = structlog.get_logger()
 
 
 class BinanceWebSocket:
     def __init__(
         self, symbol: str = "adausdt", order_manager: OrderManager | None = None
-    ):
+    ) -> None:
         self.symbol = symbol.lower()
+        self._symbol_upper = symbol.upper()  # Single subscribed stream
         self.client: SpotWebsocketStreamClient | None = None
         self.running = False
         self.order_manager = order_manager
-        self._on_message = None  # Allow custom message handler override
-        self._message_queue = asyncio.Queue()  # Queue for cross-thread communication
-        self._loop = None  # Store reference to main event loop
-
-    async def start(self):
+        # Allow custom message handler override
+        self._on_message: Callable[[dict[str, Any]], Awaitable[None]] | None = None
+        # Single-slot handoff from the WebSocket thread: newer ticks overwrite
+        # older unprocessed ones, and the loop is only poked to wake the consumer
+        self._latest: deque[dict[str, Any]] = deque(maxlen=1)
+        self._wake = asyncio.Event()
+        # Store reference to main event loop
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._last_print = 0.0
+
+    async def start(self) -> None:
         """Start the WebSocket connection"""
         logger.info(
             "🔌 Connecting to Binance WebSocket using sidan-binance-py",
-            symbol=self.symbol.upper(),
+            symbol=self._symbol_upper,
         )
         self.running = True
 
@@ -39,22 +51,17 @@ class BinanceWebSocket:
         self._loop = asyncio.get_running_loop()
 
         try:
-            # Import the suppressor from main - if not available, create a dummy one
+            # Import the suppressor from main - if not available, use a no-op
+            suppress_prints: AbstractContextManager[Any]
             try:
                 from . import main
 
-                SuppressPrints = main.SuppressPrints
+                suppress_prints = main.SuppressPrints()
             except (ImportError, AttributeError):
-
-                class SuppressPrints:
-                    def __enter__(self):
-                        return self
-
-                    def __exit__(self, exc_type, exc_val, exc_tb):
-                        pass
+                suppress_prints = nullcontext()
 
             # Create WebSocket client with message handler (suppress any debug output)
-            with SuppressPrints():
+            with suppress_prints:
                 self.client = SpotWebsocketStreamClient(
                     on_message=self._message_handler,
                     stream_url="wss://stream.binance.com:9443",  # Explicit URL to avoid debug prints
@@ -69,14 +76,14 @@ class BinanceWebSocket:
 
             logger.info(
                 "✅ Connected to Binance WebSocket successfully",
-                symbol=self.symbol.upper(),
+                symbol=self._symbol_upper,
             )
 
         except Exception as e:
             logger.error("❌ Failed to connect to Binance WebSocket", error=str(e))
             raise
 
-    async def stop(self):
+    async def stop(self) -> None:
         """Stop the WebSocket connection"""
         logger.info("🔌 Disconnecting from Binance WebSocket")
         self.running = False
@@ -85,7 +92,7 @@ class BinanceWebSocket:
             self.client.stop()
             logger.info("✅ Disconnected from Binance WebSocket")
 
-    def _message_handler(self, _, message):
+    def _message_handler(self, _: Any, message: str | dict[str, Any]) -> None:
         """Handle incoming WebSocket messages"""
         if not self.running:
             return
@@ -104,23 +111,24 @@ class BinanceWebSocket:
         except Exception as e:
             logger.error("Error in message handler", error=str(e), message=message)
 
-    def _handle_book_ticker(self, data: dict[str, Any]):
+    def _handle_book_ticker(self, data: dict[str, Any]) -> None:
         """Handle book ticker data"""
         try:
-            # If custom message handler is set, queue the message for processing
+            # If custom message handler is set, hand the latest tick to the loop
             if self._on_message and self._loop:
-                # Use thread-safe method to put message in queue
-                self._loop.call_soon_threadsafe(self._message_queue.put_nowait, data)
+                # deque.append is atomic, so only the wake-up crosses threads
+                self._latest.append(data)
+                self._loop.call_soon_threadsafe(self._wake.set)
                 return
 
-            symbol = data.get("s", "").upper()
+            symbol = self._symbol_upper
             bid_price = float(data.get("b", 0))
             bid_qty = float(data.get("B", 0))
             ask_price = float(data.get("a", 0))
             ask_qty = float(data.get("A", 0))
 
             # Print WebSocket stream info (reduced frequency to avoid spam)
-            if not hasattr(self, "_last_print") or time.time() - self._last_print > 2.0:
+            if time.time() - self._last_print > 2.0:
                 print(f"📈 {symbol} Book Ticker:")
                 print(f"   Bid: ${bid_price:.4f} (qty: {bid_qty:.2f})")
                 print(f"   Ask: ${ask_price:.4f} (qty: {ask_qty:.2f})")
@@ -145,19 +153,26 @@ class BinanceWebSocket:
         except (KeyError, ValueError, TypeError) as e:
             logger.error("Error parsing book ticker data", error=str(e), data=data)
 
-    async def _message_processor(self):
-        """Process messages from the queue using the custom handler"""
+    async def _message_processor(self) -> None:
+        """Process the latest message using the custom handler"""
         while self.running:
             try:
-                # Wait for messages from the queue
-                data = await asyncio.wait_for(self._message_queue.get(), timeout=1.0)
+                # Wait for the producer to signal a new tick
+                await asyncio.wait_for(self._wake.wait(), timeout=1.0)
+                self._wake.clear()
+
+                try:
+                    data = self._latest.popleft()
+                except IndexError:
+                    # Tick already consumed by a previous wake-up
+                    continue
 
                 # Process the message with the custom handler
                 if self._on_message:
                     await self._on_message(data)
 
             except asyncio.TimeoutError:
-                # No messages in queue, continue
+                # No new messages, continue
                 continue
             except Exception as e:
                 logger.error("Error in message processor", error=str(e))
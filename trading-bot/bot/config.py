@@ -3,108 +3,208 @@ Configuration management using Pydantic settings
 Supports environment variables and YAML configuration files
 """
 
+from collections.abc import Mapping
+import functools
+import hashlib
+import importlib
+import os
 from pathlib import Path
+import sys
+from typing import Any
+
+from pydantic import BaseModel, ConfigDict, Field, computed_field
+from pydantic_settings import (
+    BaseSettings,
+    DotEnvSettingsSource,
+    PydanticBaseSettingsSource,
+    SettingsConfigDict,
+)
+import yaml
 
-from pydantic import BaseModel, Field
-from pydantic_settings import BaseSettings, SettingsConfigDict
+from . import json_codec
+
+# Prefer the libyaml-backed loader when PyYAML was built with it
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def _read_yaml(yaml_path: Path) -> dict[str, Any]:
+    """
+    Parse a YAML config file into a plain dict
+
+    The parsed result is cached as a JSON sidecar (``config.yaml.json``) and
+    reused while it is at least as new as the YAML file. Parses are also
+    memoized in-process on both files' mtimes, so repeated loads skip the
+    file reads entirely; treat the returned dict as read-only.
+    """
+    cache_path = yaml_path.with_suffix(yaml_path.suffix + ".json")
+    try:
+        cache_mtime_ns = cache_path.stat().st_mtime_ns
+    except OSError:
+        cache_mtime_ns = 0
+    return _load_yaml(yaml_path, yaml_path.stat().st_mtime_ns, cache_mtime_ns)
+
+
+def _compiled_defaults(source: bytes) -> dict[str, Any] | None:
+    """
+    Return build-time DEFAULTS from bot/config_defaults.py for this YAML source
+
+    The module is generated by ``python -m bot.config_compile``; it is only
+    used when its recorded hash matches, so a stale module is ignored.
+    """
+    try:
+        module = importlib.import_module(".config_defaults", __package__)
+    except ImportError:
+        return None
+    if hashlib.sha256(source).hexdigest() != module.SOURCE_SHA256:
+        return None
+    defaults: dict[str, Any] = module.DEFAULTS
+    return defaults
+
+
+@functools.lru_cache(maxsize=8)
+def _load_yaml(
+    yaml_path: Path, yaml_mtime_ns: int, cache_mtime_ns: int
+) -> dict[str, Any]:
+    """Load a YAML config via its JSON sidecar; mtimes are the memo key"""
+    source = yaml_path.read_bytes()
+    compiled = _compiled_defaults(source)
+    if compiled is not None:
+        return compiled
+
+    cache_path = yaml_path.with_suffix(yaml_path.suffix + ".json")
+    if cache_mtime_ns >= yaml_mtime_ns:
+        try:
+            cached: dict[str, Any] = json_codec.loads(cache_path.read_bytes())
+            return cached
+        except (OSError, ValueError):
+            pass  # Missing or unreadable cache, fall back to YAML
+
+    data = yaml.load(source, Loader=_YamlLoader) or {}
+
+    # Write to a temp file and swap it in so readers never see a partial cache
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        tmp_path.write_bytes(json_codec.dumps(data))
+        os.replace(tmp_path, cache_path)
+    except (OSError, TypeError, ValueError):
+        # Read-only deployments or non-JSON YAML values: just skip the cache
+        tmp_path.unlink(missing_ok=True)
+
+    return data
+
+
+class PlainDotEnvSettingsSource(DotEnvSettingsSource):
+    """
+    .env source that reads plain ``KEY=VALUE`` lines without python-dotenv
+
+    Supports ``#`` comments (full-line and after whitespace), an optional
+    ``export`` prefix and single/double quoted values. No interpolation.
+    """
+
+    def _read_env_file(self, file_path: Path) -> Mapping[str, str | None]:
+        text = file_path.read_text(encoding=self.env_file_encoding or "utf-8")
+        env_vars: dict[str, str | None] = {}
+        for raw_line in text.splitlines():
+            line = raw_line.strip()
+            if not line or line.startswith("#"):
+                continue
+
+            key, sep, value = line.partition("=")
+            if not sep:
+                continue
+            key = key.removeprefix("export ").strip()
+            value = value.strip()
+
+            closing = value.find(value[0], 1) if value[:1] in ("'", '"') else -1
+            if closing > 0:
+                # Anything after the closing quote can only be a comment
+                value = value[1:closing]
+            else:
+                hash_at = value.find("#")
+                if hash_at > 0 and value[hash_at - 1].isspace():
+                    value = value[:hash_at].rstrip()
+
+            if not self.case_sensitive:
+                key = key.lower()
+            if self.env_ignore_empty and not value:
+                continue
+            env_vars[key] = None if value == self.env_parse_none_str else value
+        return env_vars
+
+
+# Config sections are read-only value carriers: no per-assignment validation,
+# and unknown keys are dropped rather than stored on the instance
+_SECTION_CONFIG = ConfigDict(
+    frozen=True,
+    validate_assignment=False,
+    extra="ignore",
+    arbitrary_types_allowed=False,
+)
 
 
 class TradingConfig(BaseModel):
     """Trading strategy configuration"""
 
-    symbol_src: str = Field(default="ADAUSDT", description="Source symbol (Binance)")
-    symbol_dst: str = Field(
-        default="ADAUSDM", description="Destination symbol (DeltaDeFi)"
-    )
+    model_config = _SECTION_CONFIG
+
+    symbol_src: str = "ADAUSDT"  # Source symbol (Binance)
+    symbol_dst: str = "ADAUSDM"  # Destination symbol (DeltaDeFi)
 
     # Multi-layer strategy parameters
-    base_spread_bps: int = Field(
-        default=8, description="Starting spread from reference price in basis points"
-    )
-    tick_spread_bps: int = Field(
-        default=10, description="Incremental spread between layers in basis points"
-    )
-    num_layers: int = Field(default=10, description="Number of layers per side")
-    layer_liquidity_multiplier: float = Field(
-        default=1.0, description="Liquidity growth factor per layer (1.0 = 100%)"
-    )
-    total_liquidity: float = Field(
-        default=5000.0, description="Total liquidity to distribute across all layers"
-    )
+    base_spread_bps: int = 8  # Starting spread from reference price in basis points
+    tick_spread_bps: int = 10  # Incremental spread between layers in basis points
+    num_layers: int = 10  # Number of layers per side
+    # Liquidity growth factor per layer (1.0 = 100%)
+    layer_liquidity_multiplier: float = 1.0
+    total_liquidity: float = 5000.0  # Total liquidity to distribute across all layers
 
     # Legacy parameters (keep for backwards compatibility)
-    anchor_bps: int = Field(
-        default=5, description="Distance from Binance BBO in basis points (legacy)"
-    )
-    venue_spread_bps: int = Field(
-        default=3,
-        description="Extra buffer for cross-venue risk in basis points (legacy)",
-    )
-    side_enable: list[str] = Field(
-        default=["bid", "ask"], description="Which sides to quote"
-    )
-    qty: float = Field(
-        default=100.0, description="Order quantity in ADA units (legacy)"
-    )
-    max_skew: float = Field(
-        default=2000.0, description="Maximum position skew in ADA before pausing"
-    )
+    anchor_bps: int = 5  # Distance from Binance BBO in basis points (legacy)
+    # Extra buffer for cross-venue risk in basis points (legacy)
+    venue_spread_bps: int = 3
+    side_enable: list[str] = ["bid", "ask"]  # Which sides to quote
+    qty: float = 100.0  # Order quantity in ADA units (legacy)
+    max_skew: float = 2000.0  # Maximum position skew in ADA before pausing
 
     # Price limits
-    min_quote_size: float = Field(default=10.0, description="Minimum quote size")
-    max_open_notional: float = Field(
-        default=10000.0, description="Maximum open notional value"
-    )
+    min_quote_size: float = 10.0  # Minimum quote size
+    max_open_notional: float = 10000.0  # Maximum open notional value
 
     # Timing controls
-    requote_tick_threshold: float = Field(
-        default=0.0001, description="Minimum price change to trigger requote"
-    )
-    min_requote_ms: int = Field(
-        default=100, description="Minimum time between requotes in milliseconds"
-    )
-    stale_ms: int = Field(
-        default=5000, description="Time before market data is considered stale"
-    )
+    requote_tick_threshold: float = 0.0001  # Minimum price change to trigger requote
+    min_requote_ms: int = 100  # Minimum time between requotes in milliseconds
+    stale_ms: int = 5000  # Time before market data is considered stale
 
     # Quote management
-    quote_ttl_ms: int = Field(
-        default=2000, description="Quote time-to-live before replacement (milliseconds)"
-    )
-    enable_aggressive_replacement: bool = Field(
-        default=True, description="Cancel existing orders immediately on price moves"
-    )
+    quote_ttl_ms: int = 2000  # Quote time-to-live before replacement (milliseconds)
+    # Cancel existing orders immediately on price moves
+    enable_aggressive_replacement: bool = True
 
     # Asset ratio management parameters
-    target_asset_ratio: float = Field(
-        default=1.0, description="Target USDM:ADA value ratio (1.0 = 1:1)"
-    )
-    ratio_tolerance: float = Field(
-        default=0.1, description="Acceptable deviation from target ratio (0.1 = 10%)"
-    )
-    spread_adjustment_factor: float = Field(
-        default=2.0, description="Multiplier for spread adjustment when out of ratio"
-    )
-    liquidity_adjustment_factor: float = Field(
-        default=1.5,
-        description="Multiplier for liquidity size adjustment when out of ratio",
-    )
-    use_full_capital: bool = Field(
-        default=True, description="Deploy 100% of available capital for market making"
-    )
-    capital_reserve_ratio: float = Field(
-        default=0.02, description="Percentage of capital to keep as reserve (0.02 = 2%)"
-    )
+    target_asset_ratio: float = 1.0  # Target USDM:ADA value ratio (1.0 = 1:1)
+    ratio_tolerance: float = 0.1  # Acceptable deviation from target ratio (0.1 = 10%)
+    # Multiplier for spread adjustment when out of ratio
+    spread_adjustment_factor: float = 2.0
+    # Multiplier for liquidity size adjustment when out of ratio
+    liquidity_adjustment_factor: float = 1.5
+    use_full_capital: bool = True  # Deploy 100% of available capital for market making
+    # Percentage of capital to keep as reserve (0.02 = 2%)
+    capital_reserve_ratio: float = 0.02
+
+    @functools.cached_property
+    def side_enable_set(self) -> frozenset[str]:
+        """Lower-cased, interned enabled sides, computed once for O(1) lookups"""
+        return frozenset(sys.intern(s.lower()) for s in self.side_enable)
 
 
 class ExchangeConfig(BaseModel):
     """Exchange connection configuration"""
 
+    model_config = _SECTION_CONFIG
+
     # DeltaDeFi API credentials
-    deltadefi_api_key: str = Field(default="", description="DeltaDeFi API key")
-    trading_password: str = Field(
-        default="", description="Trading password for operation key decryption"
-    )
+    deltadefi_api_key: str = ""  # DeltaDeFi API key
+    trading_password: str = ""  # Trading password for operation key decryption
 
     # URLs are hardcoded in DeltaDeFi SDK based on network mode:
     # - testnet: api-staging.deltadefi.io, stream-staging.deltadefi.io
@@ -115,55 +215,42 @@ class ExchangeConfig(BaseModel):
 class RiskConfig(BaseModel):
     """Risk management configuration"""
 
-    enable_oms: bool = Field(default=True, description="Enable order management system")
-    max_position_size: float = Field(
-        default=5000.0, description="Maximum position size"
-    )
-    max_daily_loss: float = Field(
-        default=1000.0, description="Maximum daily loss limit"
-    )
-    max_open_orders: int = Field(
-        default=20,
-        description="Maximum number of open orders (increased for multi-layer)",
-    )
-    max_layers_per_side: int = Field(
-        default=10, description="Maximum layers allowed per side for risk control"
-    )
-    emergency_stop: bool = Field(default=False, description="Emergency stop flag")
+    model_config = _SECTION_CONFIG
+
+    enable_oms: bool = True  # Enable order management system
+    max_position_size: float = 5000.0  # Maximum position size
+    max_daily_loss: float = 1000.0  # Maximum daily loss limit
+    # Maximum number of open orders (increased for multi-layer)
+    max_open_orders: int = 20
+    max_layers_per_side: int = 10  # Maximum layers allowed per side for risk control
+    emergency_stop: bool = False  # Emergency stop flag
 
 
 class SystemConfig(BaseModel):
     """System and operational configuration"""
 
-    mode: str = Field(
-        default="testnet", description="Trading mode: paper, testnet, or live"
-    )
-    log_level: str = Field(default="INFO", description="Logging level")
-    db_path: str = Field(default="trading_bot.db", description="SQLite database path")
+    model_config = _SECTION_CONFIG
+
+    mode: str = "testnet"  # Trading mode: paper, testnet, or live
+    log_level: str = "INFO"  # Logging level
+    db_path: str = "trading_bot.db"  # SQLite database path
+    sqlite_wal2: bool = False  # Use wal2 journal mode where the SQLite build has it
 
     # Rate limiting
-    max_orders_per_second: float = Field(
-        default=5.0, description="Maximum orders per second"
-    )
+    max_orders_per_second: float = 5.0  # Maximum orders per second
 
     # Connection management
-    reconnect_delay: float = Field(
-        default=5.0, description="Delay between reconnection attempts"
-    )
-    max_reconnect_attempts: int = Field(
-        default=10, description="Maximum reconnection attempts"
-    )
+    reconnect_delay: float = 5.0  # Delay between reconnection attempts
+    max_reconnect_attempts: int = 10  # Maximum reconnection attempts
 
     # Order management
-    cleanup_unregistered_orders: bool = Field(
-        default=True, description="Cancel orders not in database"
-    )
-    cleanup_check_interval_ms: int = Field(
-        default=30000, description="Interval for checking unregistered orders"
-    )
-    order_registration_timeout_ms: int = Field(
-        default=5000, description="Timeout for order registration in database"
-    )
+    open_orders_ttl_seconds: float = 1.0  # Reuse fetched open orders this long
+    order_batch_window_ms: float = 10.0  # Coalesce order submissions this long
+    order_batch_max_size: int = 10  # Most orders sent in one batch request
+    cleanup_unregistered_orders: bool = True  # Cancel orders not in database
+    cleanup_check_interval_ms: int = 30000  # Interval for checking unregistered orders
+    # Timeout for order registration in database
+    order_registration_timeout_ms: int = 5000
 
 
 class Settings(BaseSettings):
@@ -177,20 +264,48 @@ class Settings(BaseSettings):
         extra="ignore",
         yaml_file="config.yaml",  # Support YAML config file
         yaml_file_encoding="utf-8",
+        frozen=True,
     )
 
+    @classmethod
+    def settings_customise_sources(
+        cls,
+        settings_cls: type[BaseSettings],
+        init_settings: PydanticBaseSettingsSource,
+        env_settings: PydanticBaseSettingsSource,
+        dotenv_settings: PydanticBaseSettingsSource,
+        file_secret_settings: PydanticBaseSettingsSource,
+    ) -> tuple[PydanticBaseSettingsSource, ...]:
+        """Same source order as the default, with the lightweight .env reader"""
+        # Keep the env file and options the provided source was built with,
+        # so construction-time overrides like _env_file still apply
+        if isinstance(dotenv_settings, DotEnvSettingsSource):
+            dotenv_settings = PlainDotEnvSettingsSource(
+                settings_cls,
+                env_file=dotenv_settings.env_file,
+                env_file_encoding=dotenv_settings.env_file_encoding,
+                case_sensitive=dotenv_settings.case_sensitive,
+                env_prefix=dotenv_settings.env_prefix,
+                env_nested_delimiter=dotenv_settings.env_nested_delimiter,
+                env_ignore_empty=dotenv_settings.env_ignore_empty,
+                env_parse_none_str=dotenv_settings.env_parse_none_str,
+            )
+        return (init_settings, env_settings, dotenv_settings, file_secret_settings)
+
     # Nested configuration sections
     trading: TradingConfig = Field(default_factory=TradingConfig)
     exchange: ExchangeConfig = Field(default_factory=ExchangeConfig)
     risk: RiskConfig = Field(default_factory=RiskConfig)
     system: SystemConfig = Field(default_factory=SystemConfig)
 
-    @property
+    @computed_field  # type: ignore[prop-decorator]
+    @functools.cached_property
     def total_spread_bps(self) -> int:
         """Calculate total spread in basis points"""
         return self.trading.anchor_bps + self.trading.venue_spread_bps
 
-    @property
+    @computed_field  # type: ignore[prop-decorator]
+    @functools.cached_property
     def deltadefi_ws_url(self) -> str:
         """Get DeltaDeFi WebSocket URL - URLs are managed by DeltaDeFi SDK"""
         # URLs are hardcoded in DeltaDeFi SDK based on network mode
@@ -199,34 +314,70 @@ class Settings(BaseSettings):
 
     def is_side_enabled(self, side: str) -> bool:
         """Check if a trading side is enabled"""
-        return side.lower() in [s.lower() for s in self.trading.side_enable]
+        sides = self.trading.side_enable_set
+        # Callers pass "bid"/"ask" literals, which hit the interned members by
+        # identity; only fall back to lower() for other spellings
+        return side in sides or side.lower() in sides
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "Settings":
+        """
+        Build settings from an already-merged config dict
+
+        Each section is validated on its own and the settings sources (env
+        vars, .env file) are skipped entirely, so callers that construct
+        settings repeatedly from known data avoid re-scanning them.
+        """
+        return cls.model_construct(
+            trading=TradingConfig.model_validate(data.get("trading", {})),
+            exchange=ExchangeConfig.model_validate(data.get("exchange", {})),
+            risk=RiskConfig.model_validate(data.get("risk", {})),
+            system=SystemConfig.model_validate(data.get("system", {})),
+        )
+
+    def reload(self, data: dict[str, Any]) -> "Settings":
+        """
+        Build new settings from a config dict, reusing unchanged sections
+
+        Incoming values are laid over the current ones, so fields the dict does
+        not mention (env vars, .env, defaults) keep their values. A section
+        the dict does not change is carried over as-is (the models are frozen,
+        so sharing is safe); only changed sections are re-validated.
+        """
+        sections: dict[str, Any] = {}
+        for name in ("trading", "exchange", "risk", "system"):
+            current: BaseModel = getattr(self, name)
+            section_data = data.get(name, {})
+            values = current.model_dump()
+            if all(
+                key in values and values[key] == value
+                for key, value in section_data.items()
+            ):
+                sections[name] = current
+            else:
+                sections[name] = type(current).model_validate(
+                    {**values, **section_data}
+                )
+        return type(self).model_construct(**sections)
 
     @classmethod
     def from_yaml(cls, yaml_path: Path) -> "Settings":
         """Load settings from YAML file"""
-        import yaml
-
-        with open(yaml_path) as f:
-            data = yaml.safe_load(f)
-
-        return cls(**data)
-
-
-# Global settings instance - load from YAML if available
-from pathlib import Path
-
-import yaml
+        return cls(**_read_yaml(yaml_path))
 
 
-def _load_settings():
-    """Load settings with YAML file support"""
+@functools.lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Load the global settings on first use, from config.yaml if available"""
     yaml_path = Path("config.yaml")
     if yaml_path.exists():
-        with open(yaml_path) as f:
-            yaml_data = yaml.safe_load(f)
-        return Settings(**yaml_data)
+        return Settings.from_yaml(yaml_path)
     else:
         return Settings()
 
 
-settings = _load_settings()
+def __getattr__(name: str) -> Any:
+    """Resolve the legacy module-level ``settings`` lazily (PEP 562)"""
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
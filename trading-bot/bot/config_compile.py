@@ -0,0 +1,63 @@
+"""
+Compile config.yaml into an importable Python module
+
+Usage: python -m bot.config_compile [config.yaml] [bot/config_defaults.py]
+
+The generated module holds the parsed YAML as a literal ``DEFAULTS`` dict plus
+the SHA-256 of the source file, so bot.config can skip YAML parsing at runtime
+while it still matches the YAML on disk.
+"""
+
+import ast
+import hashlib
+from pathlib import Path
+import pprint
+import sys
+from typing import Any
+
+import yaml
+
+from .config import _YamlLoader
+
+DEFAULT_SOURCE = Path("config.yaml")
+DEFAULT_OUTPUT = Path(__file__).parent / "config_defaults.py"
+
+_TEMPLATE = '''"""
+Generated from {source_name} by `python -m bot.config_compile` - do not edit
+"""
+
+from typing import Any
+
+SOURCE_SHA256 = "{digest}"
+
+DEFAULTS: dict[str, Any] = {literal}
+'''
+
+
+def render_defaults(source: bytes, source_name: str = "config.yaml") -> str:
+    """Render the config_defaults module text for a YAML document"""
+    data: dict[str, Any] = yaml.load(source, Loader=_YamlLoader) or {}
+    literal = pprint.pformat(data, sort_dicts=False)
+    if ast.literal_eval(literal) != data:
+        raise ValueError(f"{source_name} contains values that are not Python literals")
+
+    return _TEMPLATE.format(
+        source_name=source_name,
+        digest=hashlib.sha256(source).hexdigest(),
+        literal=literal,
+    )
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Write the generated defaults module"""
+    args = sys.argv[1:] if argv is None else argv
+    source_path = Path(args[0]) if args else DEFAULT_SOURCE
+    output_path = Path(args[1]) if len(args) > 1 else DEFAULT_OUTPUT
+
+    text = render_defaults(source_path.read_bytes(), source_path.name)
+    output_path.write_text(text, encoding="utf-8")
+    print(f"Wrote {output_path} from {source_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,24 +3,52 @@ Database package initialization
 
 Provides convenient imports and initialization functions for the trading bot database layer.
 Exports key components: repositories, database manager, and utility functions.
+
+Submodules are imported lazily (PEP 562) on first attribute access, so importing
+the package does not pull in aiosqlite or build the repositories up front.
 """
 
-from .outbox_worker import (
-    cleanup_outbox_events,
-    get_outbox_stats,
-    start_outbox_worker,
-    stop_outbox_worker,
-)
-from .repo import (
-    balance_repo,
-    fill_repo,
-    order_repo,
-    outbox_repo,
-    position_repo,
-    quote_repo,
-    session_repo,
-)
-from .sqlite import close_database, db_manager, init_database
+import asyncio
+import importlib
+from typing import TYPE_CHECKING, Any
+
+import structlog
+
+if TYPE_CHECKING:
+    from .outbox_worker import (
+        cleanup_outbox_events,
+        get_outbox_stats,
+        start_outbox_worker,
+        stop_outbox_worker,
+    )
+    from .repo import (
+        balance_repo,
+        fill_repo,
+        order_repo,
+        outbox_repo,
+        position_repo,
+        quote_repo,
+        session_repo,
+    )
+    from .sqlite import close_database, db_manager, init_database
+
+# Exported name -> (submodule, attribute)
+_LAZY_EXPORTS: dict[str, tuple[str, str]] = {
+    "balance_repo": (".repo", "balance_repo"),
+    "cleanup_outbox_events": (".outbox_worker", "cleanup_outbox_events"),
+    "close_database": (".sqlite", "close_database"),
+    "db_manager": (".sqlite", "db_manager"),
+    "fill_repo": (".repo", "fill_repo"),
+    "get_outbox_stats": (".outbox_worker", "get_outbox_stats"),
+    "init_database": (".sqlite", "init_database"),
+    "order_repo": (".repo", "order_repo"),
+    "outbox_repo": (".repo", "outbox_repo"),
+    "position_repo": (".repo", "position_repo"),
+    "quote_repo": (".repo", "quote_repo"),
+    "session_repo": (".repo", "session_repo"),
+    "start_outbox_worker": (".outbox_worker", "start_outbox_worker"),
+    "stop_outbox_worker": (".outbox_worker", "stop_outbox_worker"),
+}
 
 __all__ = [
     "balance_repo",
@@ -40,23 +68,53 @@ __all__ = [
 ]
 
 
+logger = structlog.get_logger()
+
+# Background outbox worker task started by initialize_database()
+_outbox_task: asyncio.Task[None] | None = None
+
+# Seconds shutdown waits for the outbox worker to drain before cancelling it
+OUTBOX_SHUTDOWN_TIMEOUT = 10.0
+
+
+def __getattr__(name: str) -> Any:
+    """Import the owning submodule on first access and cache the export"""
+    try:
+        module_name, attr = _LAZY_EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = getattr(importlib.import_module(module_name, __name__), attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *__all__])
+
+
 async def initialize_database() -> None:
     """
     Initialize the complete database system
 
     This function:
     1. Initializes the SQLite database with schema
-    2. Starts the outbox worker for event processing
-    3. Sets up all repositories
+    2. Warms the connection pool concurrently with schema setup
+    3. Starts the outbox worker for event processing
     """
-    # Initialize database schema and connections
-    await init_database()
+    from .outbox_worker import start_outbox_worker
+    from .sqlite import db_manager
 
-    # Start outbox worker for event processing
-    # Note: This is started as a background task, caller should manage lifecycle
-    import asyncio
+    global _outbox_task
 
-    asyncio.create_task(start_outbox_worker())
+    # Schema init and pool warming are independent; a failure in either cancels the other
+    async with asyncio.TaskGroup() as tg:
+        tg.create_task(db_manager.warm_pool())
+        tg.create_task(db_manager.initialize())
+
+    # Start outbox worker for event processing
+    # Note: This runs until stop_outbox_worker(), so it is not part of the task group
+    _outbox_task = asyncio.create_task(start_outbox_worker())
 
 
 async def shutdown_database() -> None:
@@ -64,12 +122,33 @@ async def shutdown_database() -> None:
     Gracefully shutdown the database system
 
     This function:
-    1. Stops the outbox worker
-    2. Closes all database connections
-    3. Cleans up resources
+    1. Stops the outbox worker and waits for it to finish
+    2. Writes buffered quote history
+    3. Closes all database connections
+    4. Cleans up resources
     """
-    # Stop outbox worker first
+    from .outbox_worker import stop_outbox_worker
+    from .repo import quote_repo
+    from .sqlite import close_database
+
+    global _outbox_task
+
+    # Stop outbox worker first, and let it finish its in-flight batches before
+    # the connections go away (on timeout wait_for cancels it)
     await stop_outbox_worker()
+    if _outbox_task is not None:
+        try:
+            await asyncio.wait_for(_outbox_task, OUTBOX_SHUTDOWN_TIMEOUT)
+        except TimeoutError:
+            logger.warning(
+                "Outbox worker did not stop in time, cancelled",
+                timeout=OUTBOX_SHUTDOWN_TIMEOUT,
+            )
+        except Exception as e:
+            logger.error("Outbox worker failed during shutdown", error=str(e))
+        _outbox_task = None
+
+    await quote_repo.flush()
 
     # Close database connections
     await close_database()
@@ -6,19 +6,35 @@ Processes events created by repository operations and handles retries.
 """
 
 import asyncio
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
 from enum import Enum
-import json
+import logging
+from random import random as _random
 import time
 from typing import Any
 
 import structlog
 
+from .. import json_codec
 from .repo import outbox_repo
 from .sqlite import db_manager
 
 logger = structlog.get_logger()
 
+# stdlib logger behind the structlog proxy, used to skip building per-event
+# debug log entries when DEBUG is filtered out
+_stdlib_logger = logging.getLogger(__name__)
+
+# Handler method for one event type or order status: (order_id, payload)
+_Dispatch = Callable[[str, dict[str, Any]], Awaitable[None]]
+
+# Payload fields copied into the handlers' structured log lines
+_ORDER_CREATED_FIELDS = ("symbol", "side", "quantity")
+_ORDER_FILLED_FIELDS = ("filled_quantity", "avg_fill_price")
+_FILL_CREATED_FIELDS = ("fill_id", "price", "quantity")
+
 
 class EventStatus(str, Enum):
     """Event processing status"""
@@ -61,18 +77,27 @@ class CircuitBreakerConfig:
 class CircuitBreaker:
     """Circuit breaker for event handlers"""
 
+    __slots__ = (
+        "config",
+        "failure_count",
+        "last_failure_time",
+        "next_attempt_time",
+        "state",
+        "success_count",
+    )
+
     def __init__(self, config: CircuitBreakerConfig):
         self.config = config
         self.state = CircuitBreakerState.CLOSED
         self.failure_count = 0
         self.success_count = 0
-        self.last_failure_time = 0
-        self.next_attempt_time = 0
+        self.last_failure_time = 0.0  # Wall clock, for metrics
+        self.next_attempt_time = 0  # time.monotonic_ns() based
 
     async def call(self, func, *args, **kwargs):
         """Execute function through circuit breaker"""
         if self.state == CircuitBreakerState.OPEN:
-            if time.time() < self.next_attempt_time:
+            if time.monotonic_ns() < self.next_attempt_time:
                 raise Exception("Circuit breaker is OPEN")
             else:
                 # Try to recover
@@ -87,6 +112,10 @@ class CircuitBreaker:
             await self._on_failure()
             raise
 
+    def _recovery_deadline(self) -> int:
+        """Monotonic nanosecond time after which a recovery attempt is allowed"""
+        return time.monotonic_ns() + self.config.recovery_timeout * 1_000_000_000
+
     async def _on_success(self):
         """Handle successful execution"""
         if self.state == CircuitBreakerState.HALF_OPEN:
@@ -104,7 +133,7 @@ class CircuitBreaker:
 
         if self.failure_count >= self.config.failure_threshold:
             self.state = CircuitBreakerState.OPEN
-            self.next_attempt_time = time.time() + self.config.recovery_timeout
+            self.next_attempt_time = self._recovery_deadline()
             logger.warning(
                 "Circuit breaker opened",
                 failure_count=self.failure_count,
@@ -112,7 +141,7 @@ class CircuitBreaker:
             )
         elif self.state == CircuitBreakerState.HALF_OPEN:
             self.state = CircuitBreakerState.OPEN
-            self.next_attempt_time = time.time() + self.config.recovery_timeout
+            self.next_attempt_time = self._recovery_deadline()
 
 
 class DeadLetterQueue:
@@ -166,33 +195,67 @@ class DeadLetterQueue:
 class OutboxEventHandler:
     """Base class for handling specific event types"""
 
+    __slots__ = ()
+
+    # Event types this handler is known to dispatch, used to warm routing
+    event_types: tuple[str, ...] = ()
+
+    # Event types whose handling is only a log line. They are completed when
+    # claimed, so the handler runs after the fact and cannot fail them.
+    log_only_event_types: tuple[str, ...] = ()
+
     async def handle(self, event: dict[str, Any]) -> None:
         """Handle a specific event type"""
         raise NotImplementedError
 
+    @staticmethod
+    def get_payload(event: dict[str, Any]) -> dict[str, Any]:
+        """Parsed event payload, decoded once and cached on the event"""
+        payload: dict[str, Any] | None = event.get("payload_obj")
+        if payload is None:
+            payload = event["payload_obj"] = json_codec.loads(event["payload"])
+        return payload
+
 
 class OrderEventHandler(OutboxEventHandler):
     """Handles order-related events"""
 
+    __slots__ = ("_event_dispatch", "_status_dispatch", "event_types")
+
+    log_only_event_types = ("order_created",)
+
+    def __init__(self) -> None:
+        # Dispatch tables, built once per handler instead of an if/elif
+        # chain per event
+        self._event_dispatch: dict[str, _Dispatch] = {
+            "order_created": self._handle_order_created,
+            "order_status_updated": self._handle_order_status_updated,
+            "order_filled": self._handle_order_filled,
+        }
+        self.event_types = tuple(self._event_dispatch)
+        # Only statuses that need work beyond the status log are listed
+        self._status_dispatch: dict[str | None, _Dispatch] = {
+            "rejected": self._on_order_rejected,
+            "failed": self._on_order_failed,
+        }
+
     async def handle(self, event: dict[str, Any]) -> None:
         """Process order events"""
         event_type = event["event_type"]
-        payload = json.loads(event["payload"])
+        payload = self.get_payload(event)
         order_id = event["aggregate_id"]
 
-        logger.info(
-            "Processing order event",
-            event_type=event_type,
-            order_id=order_id,
-            event_id=event["event_id"],
-        )
+        if _stdlib_logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Processing order event",
+                event_type=event_type,
+                order_id=order_id,
+                event_id=event["event_id"],
+            )
 
-        if event_type == "order_created":
-            await self._handle_order_created(order_id, payload)
-        elif event_type == "order_status_updated":
-            await self._handle_order_status_updated(order_id, payload)
-        elif event_type == "order_filled":
-            await self._handle_order_filled(order_id, payload)
+        handler = self._event_dispatch.get(event_type)
+        if handler:
+            await handler(order_id, payload)
         else:
             logger.warning("Unknown order event type", event_type=event_type)
 
@@ -200,13 +263,12 @@ class OrderEventHandler(OutboxEventHandler):
         self, order_id: str, payload: dict[str, Any]
     ) -> None:
         """Handle order created events"""
-        logger.info(
-            "Order created",
-            order_id=order_id,
-            symbol=payload.get("symbol"),
-            side=payload.get("side"),
-            quantity=payload.get("quantity"),
-        )
+        if _stdlib_logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Order created",
+                order_id=order_id,
+                **{field: payload.get(field) for field in _ORDER_CREATED_FIELDS},
+            )
 
     async def _handle_order_status_updated(
         self, order_id: str, payload: dict[str, Any]
@@ -222,39 +284,20 @@ class OrderEventHandler(OutboxEventHandler):
         )
 
         # Handle specific status transitions
-        if status == "submitted":
-            # Order successfully submitted to DeltaDeFi
-            await self._on_order_submitted(order_id, payload)
-        elif status == "filled":
-            # Order fully filled
-            await self._on_order_filled(order_id, payload)
-        elif status == "rejected":
-            # Order rejected
-            await self._on_order_rejected(order_id, payload)
-        elif status == "failed":
-            # Order failed to submit
-            await self._on_order_failed(order_id, payload)
+        handler = self._status_dispatch.get(status)
+        if handler:
+            await handler(order_id, payload)
 
     async def _handle_order_filled(
         self, order_id: str, payload: dict[str, Any]
     ) -> None:
         """Handle order fill events"""
-        filled_quantity = payload.get("filled_quantity")
-        avg_fill_price = payload.get("avg_fill_price")
-
         logger.info(
             "Order filled",
             order_id=order_id,
-            filled_quantity=filled_quantity,
-            avg_fill_price=avg_fill_price,
+            **{field: payload.get(field) for field in _ORDER_FILLED_FIELDS},
         )
 
-    async def _on_order_submitted(self, order_id: str, payload: dict[str, Any]) -> None:
-        """Handle order submission"""
-
-    async def _on_order_filled(self, order_id: str, payload: dict[str, Any]) -> None:
-        """Handle order fill"""
-
     async def _on_order_rejected(self, order_id: str, payload: dict[str, Any]) -> None:
         """Handle order rejection"""
         error_message = payload.get("error_message")
@@ -269,21 +312,33 @@ class OrderEventHandler(OutboxEventHandler):
 class FillEventHandler(OutboxEventHandler):
     """Handles fill-related events"""
 
+    __slots__ = ("_event_dispatch", "event_types")
+
+    log_only_event_types = ("fill_created",)
+
+    def __init__(self) -> None:
+        self._event_dispatch: dict[str, _Dispatch] = {
+            "fill_created": self._handle_fill_created,
+        }
+        self.event_types = tuple(self._event_dispatch)
+
     async def handle(self, event: dict[str, Any]) -> None:
         """Process fill events"""
         event_type = event["event_type"]
-        payload = json.loads(event["payload"])
+        payload = self.get_payload(event)
         order_id = event["aggregate_id"]
 
-        logger.info(
-            "Processing fill event",
-            event_type=event_type,
-            order_id=order_id,
-            event_id=event["event_id"],
-        )
+        if _stdlib_logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Processing fill event",
+                event_type=event_type,
+                order_id=order_id,
+                event_id=event["event_id"],
+            )
 
-        if event_type == "fill_created":
-            await self._handle_fill_created(order_id, payload)
+        handler = self._event_dispatch.get(event_type)
+        if handler:
+            await handler(order_id, payload)
         else:
             logger.warning("Unknown fill event type", event_type=event_type)
 
@@ -294,12 +349,32 @@ class FillEventHandler(OutboxEventHandler):
         logger.info(
             "Fill created",
             order_id=order_id,
-            fill_id=payload.get("fill_id"),
-            price=payload.get("price"),
-            quantity=payload.get("quantity"),
+            **{field: payload.get(field) for field in _FILL_CREATED_FIELDS},
         )
 
 
+class _BatchOutcome:
+    """Outcomes of one claimed batch, recorded once all its events are handled"""
+
+    __slots__ = ("completed", "done", "failures", "remaining")
+
+    def __init__(self, size: int):
+        self.completed: list[str] = []
+        self.failures: list[tuple[str, str, int]] = []
+        self.remaining = size
+        self.done: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+
+
+# Upper bound on cached event type routes in OutboxWorker
+_ROUTE_CACHE_SIZE = 1024
+
+# Parsed payloads kept for events awaiting a retry
+_PAYLOAD_CACHE_SIZE = 512
+
+# Longest wait between polls of an idle outbox, in seconds
+_MAX_IDLE_POLL_INTERVAL = 30.0
+
+
 class OutboxWorker:
     """
     Enhanced background worker that processes events from the outbox table
@@ -324,12 +399,26 @@ class OutboxWorker:
         self.max_concurrent = max_concurrent
         self.poll_interval = poll_interval
         self.running = False
-        self.semaphore = asyncio.Semaphore(max_concurrent)
 
         # Configuration
         self.retry_config = retry_config or RetryConfig()
         self.circuit_breaker_config = circuit_breaker_config or CircuitBreakerConfig()
 
+        # Backoff delays per retry attempt, before jitter
+        self._delay_table = [
+            self._backoff_delay(i) for i in range(self.retry_config.max_retries + 1)
+        ]
+
+        # Static part of get_metrics(), built once
+        self._configuration_metrics = {
+            "batch_size": self.batch_size,
+            "max_concurrent": self.max_concurrent,
+            "poll_interval": self.poll_interval,
+            "max_retries": self.retry_config.max_retries,
+            "base_delay": self.retry_config.base_delay,
+            "max_delay": self.retry_config.max_delay,
+        }
+
         # Components
         self.dead_letter_queue = DeadLetterQueue()
         self.circuit_breakers: dict[str, CircuitBreaker] = {}
@@ -339,6 +428,7 @@ class OutboxWorker:
         self.failed_count = 0
         self.dlq_count = 0
         self.start_time = time.time()
+        self._start_ns = time.monotonic_ns()
 
         # Event handlers by event type prefix
         self.handlers = {
@@ -352,6 +442,42 @@ class OutboxWorker:
                 self.circuit_breaker_config
             )
 
+        # Set when new events are written, to end an idle wait early
+        self._wake = asyncio.Event()
+
+        # Claimed events waiting for one of max_concurrent long-lived consumers;
+        # bounded so claiming stays at most a couple of batches ahead
+        self._queue: asyncio.Queue[tuple[dict[str, Any], _BatchOutcome]] = (
+            asyncio.Queue(maxsize=2 * batch_size)
+        )
+        self._consumers: list[asyncio.Task[None]] = []
+        self._in_flight: set[asyncio.Future[None]] = set()
+
+        # Next batch fetched while the current one is being handled
+        self._next_fetch: asyncio.Task[list[dict[str, Any]]] | None = None
+
+        # Shared breaker for event types without a registered handler prefix
+        self._default_circuit_breaker = CircuitBreaker(self.circuit_breaker_config)
+
+        # Parsed payloads of failed events by event ID, reused on retry (LRU)
+        self._payload_cache: OrderedDict[str, dict[str, Any]] = OrderedDict()
+
+        # Resolved (handler, circuit breaker) per event type
+        self._route_cache: dict[
+            str, tuple[OutboxEventHandler | None, CircuitBreaker]
+        ] = {}
+        for handler in self.handlers.values():
+            for event_type in handler.event_types:
+                self._route(event_type)
+
+        # Event types completed as they are claimed, skipping the consumers
+        self._log_only_types = frozenset(
+            event_type
+            for handler in self.handlers.values()
+            for event_type in handler.log_only_event_types
+            if self._route(event_type)[0] is handler
+        )
+
     async def start(self) -> None:
         """Start the outbox worker"""
         if self.running:
@@ -366,82 +492,259 @@ class OutboxWorker:
             poll_interval=self.poll_interval,
         )
 
+        outbox_repo.add_listener(self._wake.set)
+        empty_polls = 0
         try:
             while self.running:
-                await self._process_batch()
-                await asyncio.sleep(self.poll_interval)
+                # A full batch means more events are likely queued: poll again now.
+                # Batches are not awaited, so the next one starts dispatching
+                # while stragglers from this one finish
+                count = await self._process_batch(wait=False)
+                if count >= self.batch_size:
+                    empty_polls = 0
+                    continue
+
+                # The outbox is drained. Wait one poll interval after a partial
+                # batch, backing off further while idle; a new event ends the
+                # wait immediately
+                if count:
+                    empty_polls = 0
+                timeout = min(
+                    self.poll_interval * 2**empty_polls, _MAX_IDLE_POLL_INTERVAL
+                )
+                if not count:
+                    empty_polls = min(empty_polls + 1, 16)
+                try:
+                    await asyncio.wait_for(self._wake.wait(), timeout=timeout)
+                except TimeoutError:
+                    pass
+                self._wake.clear()
         except asyncio.CancelledError:
             logger.info("Outbox worker cancelled")
         except Exception as e:
             logger.error("Outbox worker error", error=str(e), exc_info=True)
         finally:
             self.running = False
+            outbox_repo.remove_listener(self._wake.set)
+            if self._in_flight:
+                await asyncio.gather(*self._in_flight)
+            await self._stop_consumers()
+            await self._release_prefetch()
             logger.info("Outbox worker stopped")
 
+    async def _release_prefetch(self) -> None:
+        """Hand back a prefetched batch that will not be processed"""
+        if self._next_fetch is None:
+            return
+
+        fetch, self._next_fetch = self._next_fetch, None
+        try:
+            # Let the claim finish rather than cancel it, since the database
+            # thread may commit it regardless
+            events = await fetch
+            await outbox_repo.release_events([event["event_id"] for event in events])
+        except Exception as e:
+            logger.error("Error releasing prefetched events", error=str(e))
+
     async def stop(self) -> None:
         """Stop the outbox worker"""
         logger.info("Stopping outbox worker")
         self.running = False
+        self._wake.set()
+
+    async def _process_batch(self, wait: bool = True) -> int:
+        """
+        Process a batch of pending events
+
+        Events are handed to the consumer queue. With ``wait`` the call returns
+        once the batch's outcomes are recorded; otherwise it returns as soon as
+        every event is queued.
 
-    async def _process_batch(self) -> None:
-        """Process a batch of pending events"""
+        Returns the number of events in the batch; a full batch means more
+        events may be waiting
+        """
         try:
-            # Get pending events
-            events = await outbox_repo.get_pending_events(self.batch_size)
+            # Claim pending events, using the prefetch from the previous batch if any
+            if self._next_fetch is not None:
+                fetch, self._next_fetch = self._next_fetch, None
+                events = await fetch
+            else:
+                events = await self._claim_events()
 
-            if not events:
-                return
+            claimed = len(events)
+            if not claimed:
+                return 0
 
-            logger.debug("Processing event batch", count=len(events))
+            logger.debug("Processing event batch", count=claimed)
 
-            # Process events concurrently
-            tasks = [self._process_event(event) for event in events]
+            # Claim the next batch while this one is being handled, unless this
+            # batch already drained the outbox
+            if claimed >= self.batch_size:
+                self._next_fetch = asyncio.create_task(self._claim_events())
+
+            # Log-only events came back completed; only the rest need consumers
+            events = await self._log_completed_events(events)
+            if not events:
+                return claimed
 
-            await asyncio.gather(*tasks, return_exceptions=True)
+            # Queue events for the max_concurrent consumers; the queue bound
+            # applies backpressure when consumers fall behind
+            self._ensure_consumers()
+            batch = _BatchOutcome(len(events))
+            for event in events:
+                await self._queue.put((event, batch))
+
+            if wait:
+                await batch.done
+            else:
+                self._in_flight.add(batch.done)
+                batch.done.add_done_callback(self._in_flight.discard)
+            return claimed
 
         except Exception as e:
             logger.error("Error processing event batch", error=str(e), exc_info=True)
+            return 0
 
-    async def _process_event(self, event: dict[str, Any]) -> None:
-        """Process a single event with concurrency control"""
-        async with self.semaphore:
-            await self._handle_event(event)
+    async def _claim_events(self) -> list[dict[str, Any]]:
+        """Claim the next batch, completing log-only events in the same write"""
+        return await outbox_repo.claim_pending_events(
+            self.batch_size, self._log_only_types
+        )
 
-    async def _handle_event(self, event: dict[str, Any]) -> None:
-        """Handle a single event with enhanced error handling"""
+    async def _log_completed_events(
+        self, events: list[dict[str, Any]]
+    ) -> list[dict[str, Any]]:
+        """Run handlers for events completed at claim time; return the others"""
+        remaining = []
+        for event in events:
+            if event["status"] != EventStatus.COMPLETED:
+                remaining.append(event)
+                continue
+
+            handler, _ = self._route(event["event_type"])
+            try:
+                await handler.handle(event)  # type: ignore[union-attr]
+            except Exception as e:
+                logger.warning(
+                    "Log-only event handler failed",
+                    event_id=event["event_id"],
+                    event_type=event["event_type"],
+                    error=str(e),
+                )
+            self.processed_count += 1
+        return remaining
+
+    def _ensure_consumers(self) -> None:
+        """Start the consumer tasks if they are not running"""
+        # max_concurrent long-lived consumers bound concurrency on their own:
+        # events are awaited inline, with no per-event task, wrapper or semaphore
+        self._consumers = [task for task in self._consumers if not task.done()]
+        for _ in range(self.max_concurrent - len(self._consumers)):
+            self._consumers.append(asyncio.create_task(self._consume_events()))
+
+    async def _stop_consumers(self) -> None:
+        """Cancel the consumer tasks and hand back events still queued"""
+        for task in self._consumers:
+            task.cancel()
+        await asyncio.gather(*self._consumers, return_exceptions=True)
+        self._consumers = []
+
+        # Only a batch interrupted while being queued can leave events behind
+        leftover: list[str] = []
+        while not self._queue.empty():
+            event, _ = self._queue.get_nowait()
+            self._queue.task_done()
+            leftover.append(event["event_id"])
+        if leftover:
+            try:
+                await outbox_repo.release_events(leftover)
+            except Exception as e:
+                logger.error("Error releasing queued events", error=str(e))
+
+    async def _consume_events(self) -> None:
+        """Consumer loop: handle queued events, recording each batch when done"""
+        while True:
+            event, batch = await self._queue.get()
+            try:
+                await self._handle_event(event, batch.completed, batch.failures)
+            except Exception as e:
+                # Keep consuming; the event stays 'processing' like a crashed handler
+                logger.error(
+                    "Unexpected error handling event",
+                    event_id=event.get("event_id"),
+                    error=str(e),
+                )
+                if _stdlib_logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Unexpected error traceback", exc_info=True)
+            finally:
+                self._queue.task_done()
+
+            batch.remaining -= 1
+            if batch.remaining == 0:
+                await self._record_batch(batch)
+
+    async def _record_batch(self, batch: _BatchOutcome) -> None:
+        """Record all outcomes of a finished batch in one transaction"""
+        try:
+            await outbox_repo.mark_events_results(batch.completed, batch.failures)
+        except Exception as e:
+            logger.error("Error recording batch results", error=str(e), exc_info=True)
+        finally:
+            batch.done.set_result(None)
+
+    async def _handle_event(
+        self,
+        event: dict[str, Any],
+        completed: list[str],
+        failures: list[tuple[str, str, int]],
+    ) -> None:
+        """
+        Handle a single event with enhanced error handling
+
+        The event must already be marked as processing. Completions and retries
+        are appended to ``completed`` / ``failures`` for the caller to persist
+        in one batch; dead-lettered events are written immediately.
+        """
         event_id = event["event_id"]
         event_type = event["event_type"]
         retry_count = event.get("retry_count", 0)
 
-        try:
-            # Mark as processing
-            await outbox_repo.mark_event_processing(event_id)
+        # Reuse the payload parsed on an earlier attempt, if still cached
+        cached_payload = self._payload_cache.pop(event_id, None)
+        if cached_payload is not None:
+            event["payload_obj"] = cached_payload
 
+        try:
             # Find appropriate handler and circuit breaker
-            handler = self._get_handler(event_type)
+            handler, circuit_breaker = self._route(event_type)
             if not handler:
                 raise ValueError(f"No handler found for event type: {event_type}")
 
-            circuit_breaker = self._get_circuit_breaker(event_type)
-
             # Process the event through circuit breaker
             await circuit_breaker.call(handler.handle, event)
 
             # Mark as completed
-            await outbox_repo.mark_event_completed(event_id)
+            completed.append(event_id)
             self.processed_count += 1
 
-            logger.debug(
-                "Event processed successfully",
-                event_id=event_id,
-                event_type=event_type,
-                retry_count=retry_count,
-            )
+            if _stdlib_logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Event processed successfully",
+                    event_id=event_id,
+                    event_type=event_type,
+                    retry_count=retry_count,
+                )
 
         except Exception as e:
             error_msg = str(e)
             self.failed_count += 1
 
+            # Tracebacks are costly to format during a fault storm; debug only
+            if _stdlib_logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Event processing traceback", event_id=event_id, exc_info=True
+                )
+
             # Check if we should send to DLQ
             if retry_count >= self.retry_config.max_retries:
                 # Send to dead letter queue
@@ -459,7 +762,8 @@ class OutboxWorker:
             else:
                 # Schedule for retry with exponential backoff
                 retry_delay = self._calculate_retry_delay(retry_count)
-                await outbox_repo.mark_event_failed(event_id, error_msg, retry_delay)
+                failures.append((event_id, error_msg, retry_delay))
+                self._cache_payload(event)
 
                 logger.warning(
                     "Event processing failed, will retry",
@@ -471,6 +775,31 @@ class OutboxWorker:
                     next_retry_at=time.time() + retry_delay,
                 )
 
+    def _cache_payload(self, event: dict[str, Any]) -> None:
+        """Keep a failed event's parsed payload for its next attempt"""
+        payload = event.get("payload_obj")
+        if payload is None:
+            return
+
+        self._payload_cache[event["event_id"]] = payload
+        if len(self._payload_cache) > _PAYLOAD_CACHE_SIZE:
+            self._payload_cache.popitem(last=False)
+
+    def _route(
+        self, event_type: str
+    ) -> tuple[OutboxEventHandler | None, CircuitBreaker]:
+        """Resolve handler and circuit breaker for an event type, cached"""
+        route = self._route_cache.get(event_type)
+        if route is None:
+            if len(self._route_cache) >= _ROUTE_CACHE_SIZE:
+                self._route_cache.clear()
+            route = (
+                self._get_handler(event_type),
+                self._get_circuit_breaker(event_type),
+            )
+            self._route_cache[event_type] = route
+        return route
+
     def _get_handler(self, event_type: str) -> OutboxEventHandler | None:
         """Get the appropriate handler for an event type"""
         for prefix, handler in self.handlers.items():
@@ -483,30 +812,35 @@ class OutboxWorker:
         for prefix, circuit_breaker in self.circuit_breakers.items():
             if event_type.startswith(prefix):
                 return circuit_breaker
-        # Fallback to a default circuit breaker
-        return CircuitBreaker(self.circuit_breaker_config)
+        # Fallback to the shared default circuit breaker
+        return self._default_circuit_breaker
 
     def _calculate_retry_delay(self, retry_count: int) -> int:
         """Calculate exponential backoff delay with optional jitter"""
-        import random
-
         # Exponential backoff: base_delay * (multiplier ^ retry_count)
-        delay = min(
-            self.retry_config.base_delay
-            * (self.retry_config.backoff_multiplier**retry_count),
-            self.retry_config.max_delay,
-        )
+        if retry_count < len(self._delay_table):
+            delay = self._delay_table[retry_count]
+        else:
+            delay = self._backoff_delay(retry_count)
 
         # Add jitter to prevent thundering herd
         if self.retry_config.jitter:
-            jitter = random.uniform(0.8, 1.2)  # ±20% jitter
+            jitter = 0.8 + _random() * 0.4  # ±20% jitter
             delay = int(delay * jitter)
 
         return int(delay)
 
+    def _backoff_delay(self, retry_count: int) -> float:
+        """Un-jittered backoff delay for a retry attempt"""
+        return min(
+            self.retry_config.base_delay
+            * (self.retry_config.backoff_multiplier**retry_count),
+            self.retry_config.max_delay,
+        )
+
     def get_metrics(self) -> dict[str, Any]:
         """Get worker performance metrics"""
-        uptime = time.time() - self.start_time
+        uptime = (time.monotonic_ns() - self._start_ns) / 1_000_000_000
 
         return {
             "uptime_seconds": uptime,
@@ -525,14 +859,7 @@ class OutboxWorker:
                 }
                 for prefix, cb in self.circuit_breakers.items()
             },
-            "configuration": {
-                "batch_size": self.batch_size,
-                "max_concurrent": self.max_concurrent,
-                "poll_interval": self.poll_interval,
-                "max_retries": self.retry_config.max_retries,
-                "base_delay": self.retry_config.base_delay,
-                "max_delay": self.retry_config.max_delay,
-            },
+            "configuration": self._configuration_metrics,
         }
 
     async def reset_circuit_breaker(self, handler_prefix: str) -> bool:
@@ -576,9 +903,73 @@ class OutboxWorker:
             return 0
 
 
+# Rows deleted per transaction by OutboxMonitor.cleanup_completed_events
+_CLEANUP_CHUNK_SIZE = 1000
+
+
 class OutboxMonitor:
     """Enhanced outbox health monitoring and alerting"""
 
+    # Fixed query texts, so the connection's statement cache reuses them
+    STATUS_RETRY_COUNTS_QUERY = """
+    SELECT status, retry_count, COUNT(*) as count
+    FROM outbox
+    GROUP BY status, retry_count
+    """
+
+    # Parameters: (processed_after, stuck_before)
+    QUEUE_HEALTH_QUERY = """
+    WITH
+        oldest AS (
+            SELECT MIN(created_at) AS oldest
+            FROM outbox WHERE status = 'pending'
+        ),
+        rate AS (
+            SELECT COUNT(*) AS hourly_processed
+            FROM outbox
+            WHERE status = 'completed' AND processed_at > ?
+        ),
+        stuck AS (
+            SELECT
+                event_id,
+                event_type,
+                created_at,
+                COALESCE(last_error_at, created_at) AS updated_at
+            FROM outbox
+            WHERE status = 'processing'
+            AND COALESCE(last_error_at, created_at) < ?
+            ORDER BY updated_at ASC
+            LIMIT 10
+        )
+    SELECT
+        oldest.oldest,
+        rate.hourly_processed,
+        stuck.event_id,
+        stuck.event_type,
+        stuck.created_at,
+        stuck.updated_at
+    FROM oldest CROSS JOIN rate LEFT JOIN stuck ON 1
+    ORDER BY stuck.updated_at ASC
+    """
+
+    EVENT_TYPE_COUNTS_QUERY = """
+    SELECT event_type, status, COUNT(*) as count
+    FROM outbox
+    GROUP BY event_type, status
+    """
+
+    # Parameters: (processed_before, chunk_size). Deleting in bounded chunks
+    # keeps each write lock short enough for the worker to interleave
+    CLEANUP_CHUNK_QUERY = """
+    DELETE FROM outbox
+    WHERE rowid IN (
+        SELECT rowid FROM outbox
+        WHERE status = 'completed'
+        AND processed_at < ?
+        LIMIT ?
+    )
+    """
+
     def __init__(self):
         self.alert_thresholds = {
             "max_pending_events": 1000,
@@ -591,85 +982,60 @@ class OutboxMonitor:
     async def get_stats(self) -> dict[str, Any]:
         """Get comprehensive outbox processing statistics"""
         try:
-            # Count events by status
-            status_counts = {}
-            for status in [
-                "pending",
-                "processing",
-                "completed",
-                "failed",
-                "dead_letter",
-            ]:
-                query = "SELECT COUNT(*) as count FROM outbox WHERE status = ?"
-                result = await db_manager.fetch_one(query, (status,))
-                status_counts[status] = result["count"] if result else 0
-
-            # Get oldest pending event age
-            oldest_pending = await db_manager.fetch_one(
-                "SELECT MIN(created_at) as oldest FROM outbox WHERE status = 'pending'"
+            # Count events by status, and failed events by retry count, from
+            # one grouped scan
+            status_counts = dict.fromkeys(
+                ["pending", "processing", "completed", "failed", "dead_letter"], 0
             )
+            retry_counts = {f"retry_{i}": 0 for i in range(7)}  # 0-6 retries
+            rows = await db_manager.fetch_all(self.STATUS_RETRY_COUNTS_QUERY)
+            for row in rows:
+                status = row["status"]
+                if status in status_counts:
+                    status_counts[status] += row["count"]
+                if status in ("failed", "dead_letter") and row["retry_count"] < 7:
+                    retry_counts[f"retry_{row['retry_count']}"] += row["count"]
+
+            # Oldest pending event, 24h processing rate and stuck events in one
+            # round-trip. The scalar CTEs are single-row, so every result row
+            # carries them and the LEFT JOIN yields one row even with no stuck
+            # events. The outbox has no updated_at column; an event's last
+            # activity is its last error, or its creation if it never failed.
+            now = time.time()
+            rows = await db_manager.fetch_all(
+                self.QUEUE_HEALTH_QUERY, (now - 86400, now - 1800)
+            )  # Last 24 hours; stuck for 30+ minutes
 
             oldest_pending_age = None
-            if oldest_pending and oldest_pending["oldest"]:
-                oldest_pending_age = time.time() - oldest_pending["oldest"]
-
-            # Get failed events count by retry count
-            retry_counts = {}
-            for i in range(7):  # 0-6 retries
-                query = "SELECT COUNT(*) as count FROM outbox WHERE retry_count = ? AND status IN ('failed', 'dead_letter')"
-                result = await db_manager.fetch_one(query, (i,))
-                retry_counts[f"retry_{i}"] = result["count"] if result else 0
+            if rows[0]["oldest"]:
+                oldest_pending_age = now - rows[0]["oldest"]
+            hourly_processed = rows[0]["hourly_processed"]
+            stuck_events = [
+                {
+                    "event_id": row["event_id"],
+                    "event_type": row["event_type"],
+                    "created_at": row["created_at"],
+                    "updated_at": row["updated_at"],
+                }
+                for row in rows
+                if row["event_id"] is not None
+            ]
 
             # Get events by type
-            event_type_stats = await db_manager.fetch_all(
-                """
-                SELECT
-                    event_type,
-                    status,
-                    COUNT(*) as count
-                FROM outbox
-                GROUP BY event_type, status
-            """
-            )
-
-            # Get processing rate (events per hour in last 24 hours)
-            processing_rate = await db_manager.fetch_one(
-                """
-                SELECT COUNT(*) as hourly_processed
-                FROM outbox
-                WHERE status = 'completed'
-                AND processed_at > ?
-            """,
-                (time.time() - 86400,),
-            )  # Last 24 hours
+            event_type_stats = await db_manager.fetch_all(self.EVENT_TYPE_COUNTS_QUERY)
 
             # Calculate health score
             health_score = await self._calculate_health_score(
                 status_counts, oldest_pending_age
             )
 
-            # Get stuck events (processing for too long)
-            stuck_events = await db_manager.fetch_all(
-                """
-                SELECT event_id, event_type, created_at, updated_at
-                FROM outbox
-                WHERE status = 'processing'
-                AND updated_at < ?
-                ORDER BY updated_at ASC
-                LIMIT 10
-            """,
-                (time.time() - 1800,),
-            )  # Stuck for 30+ minutes
-
             return {
                 "status_counts": status_counts,
                 "oldest_pending_age_seconds": oldest_pending_age,
                 "retry_counts": retry_counts,
                 "total_events": sum(status_counts.values()),
                 "event_type_stats": event_type_stats,
-                "processing_rate_24h": processing_rate["hourly_processed"]
-                if processing_rate
-                else 0,
+                "processing_rate_24h": hourly_processed,
                 "health_score": health_score,
                 "stuck_events": stuck_events,
                 "alerts": await self._check_alerts(status_counts, oldest_pending_age),
@@ -778,20 +1144,28 @@ class OutboxMonitor:
     async def cleanup_completed_events(self, older_than_hours: int = 24) -> int:
         """Clean up completed events older than specified hours"""
         try:
-            cutoff_time = asyncio.get_event_loop().time() - (older_than_hours * 3600)
+            # processed_at is a unix timestamp
+            cutoff_time = time.time() - (older_than_hours * 3600)
+
+            deleted_count = 0
+            while True:
+                async with db_manager.get_connection() as conn:
+                    cursor = await conn.execute(
+                        self.CLEANUP_CHUNK_QUERY, (cutoff_time, _CLEANUP_CHUNK_SIZE)
+                    )
+                    chunk_count = cursor.rowcount
+                    await conn.commit()
 
-            query = """
-            DELETE FROM outbox
-            WHERE status = 'completed'
-            AND processed_at < ?
-            """
+                deleted_count += chunk_count
+                if chunk_count < _CLEANUP_CHUNK_SIZE:
+                    break
 
-            async with db_manager.get_connection() as conn:
-                cursor = await conn.execute(query, (cutoff_time,))
-                deleted_count = cursor.rowcount
-                await conn.commit()
+                # Let the worker's writes in between chunks
+                await asyncio.sleep(0)
 
             if deleted_count > 0:
+                # Keep the WAL from growing unbounded after bulk deletes
+                await db_manager.checkpoint()
                 logger.info(
                     "Cleaned up completed events",
                     count=deleted_count,
@@ -5,32 +5,103 @@ Provides high-level data access methods for the trading bot's core entities.
 Uses the outbox pattern for reliable event publishing.
 """
 
+import asyncio
+from collections.abc import Callable, Collection
 import json
+import secrets
 from typing import Any
-import uuid
 
+import aiosqlite
 import structlog
 
-from .sqlite import db_manager
+from .. import json_codec
+from .sqlite import db_manager, dict_rows
 
 logger = structlog.get_logger()
 
+# Outbox payloads are stored as encoded, a UTF-8 JSON BLOB, so neither the
+# write nor the read side pays for a str round trip. Both loaders accept TEXT
+# and BLOB rows. JSON stored in TEXT columns or bound for json_each() is text,
+# since SQLite's JSON functions reject BLOBs.
+_dumps_payload = json_codec.dumps
+_dumps_json = json_codec.dumps_str
+
+# quotes.sides_enabled is a bitfield: bid = 1, ask = 2
+_SIDE_BITS = (("bid", 1), ("ask", 2))
+
+
+def encode_sides(sides: Collection[str]) -> int:
+    """Pack enabled quote sides into the quotes.sides_enabled bitfield"""
+    return (1 if "bid" in sides else 0) | (2 if "ask" in sides else 0)
+
+
+def decode_sides(value: int | str | bytes) -> list[str]:
+    """Unpack quotes.sides_enabled; rows written before the bitfield hold JSON"""
+    if isinstance(value, int):
+        bits = value
+    else:
+        try:
+            bits = int(value)
+        except ValueError:
+            sides: list[str] = json.loads(value)
+            return sides
+    return [side for side, bit in _SIDE_BITS if bits & bit]
+
+
+# Outbox insert used by the repositories that publish events alongside their
+# own writes, inside the same transaction. No caller needs the event ID, so
+# SQLite generates it (32 hex digits, as add_event uses).
+_PUBLISH_EVENT_QUERY = """
+INSERT INTO outbox (event_id, event_type, aggregate_id, payload)
+VALUES (lower(hex(randomblob(16))), ?, ?, ?)
+"""
+
+
+async def _publish_event(
+    conn: aiosqlite.Connection,
+    event_type: str,
+    aggregate_id: str,
+    payload: dict[str, Any],
+) -> None:
+    """Write an event to the outbox on the caller's open transaction"""
+    await conn.execute(
+        _PUBLISH_EVENT_QUERY,
+        (event_type, aggregate_id, _dumps_payload(payload)),
+    )
+
 
 class QuoteRepository:
     """Repository for quote-related database operations"""
 
-    async def create_quote(self, quote_data: dict[str, Any]) -> int:
-        """Create a new quote record"""
-        query = """
-        INSERT INTO quotes (
-            timestamp, symbol_src, symbol_dst,
-            source_bid_price, source_bid_qty, source_ask_price, source_ask_qty,
-            bid_price, bid_qty, ask_price, ask_qty,
-            spread_bps, mid_price, total_spread_bps, sides_enabled
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """
-
-        params = (
+    # quote_id is generated by SQLite unless the caller supplies one
+    INSERT_QUOTE_QUERY = """
+    INSERT INTO quotes (
+        quote_id, timestamp, symbol_src, symbol_dst,
+        source_bid_price, source_bid_qty, source_ask_price, source_ask_qty,
+        bid_price, bid_qty, ask_price, ask_qty,
+        spread_bps, mid_price, total_spread_bps, sides_enabled
+    ) VALUES (
+        COALESCE(?, lower(hex(randomblob(16)))),
+        ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?
+    )
+    """
+
+    # record_quote buffers up to FLUSH_SIZE quotes, or FLUSH_INTERVAL seconds
+    # worth, and writes them with one executemany
+    FLUSH_SIZE = 200
+    FLUSH_INTERVAL = 0.05
+
+    def __init__(self) -> None:
+        self._pending: list[tuple[Any, ...]] = []
+        self._flush_task: asyncio.Task[None] | None = None
+
+    @staticmethod
+    def _quote_params(quote_data: dict[str, Any]) -> tuple[Any, ...]:
+        # Plain subscripts are the cheapest way to build this tuple. An
+        # itemgetter over all columns needs the optional keys filled in first,
+        # and that dict merge made it twice as slow
+        return (
+            quote_data.get("quote_id"),
             quote_data["timestamp"],
             quote_data["symbol_src"],
             quote_data["symbol_dst"],
@@ -45,15 +116,60 @@ class QuoteRepository:
             quote_data.get("spread_bps"),
             quote_data.get("mid_price"),
             quote_data["total_spread_bps"],
-            json.dumps(quote_data["sides_enabled"]),
+            encode_sides(quote_data["sides_enabled"]),
         )
 
-        quote_id = await db_manager.execute(query, params)
+    async def create_quote(self, quote_data: dict[str, Any]) -> int:
+        """Create a new quote record"""
+        quote_id = await db_manager.execute(
+            self.INSERT_QUOTE_QUERY, self._quote_params(quote_data)
+        )
         logger.info(
             "Created quote record", quote_id=quote_id, symbol=quote_data["symbol_dst"]
         )
         return quote_id
 
+    async def record_quote(self, quote_data: dict[str, Any]) -> None:
+        """
+        Buffer a quote for a batched insert
+
+        For per-tick quote history where no row ID is needed. Buffered quotes
+        are written within FLUSH_INTERVAL, and are visible to get_recent_quotes
+        straight away.
+        """
+        self._pending.append(self._quote_params(quote_data))
+        if len(self._pending) >= self.FLUSH_SIZE:
+            await self.flush()
+        elif self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_later())
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self.FLUSH_INTERVAL)
+        self._flush_task = None
+        try:
+            await self.flush()
+        except Exception as e:
+            logger.error(
+                "Failed to flush quote history, will retry",
+                pending=len(self._pending),
+                error=str(e),
+            )
+
+    async def flush(self) -> None:
+        """Write buffered quotes in one transaction"""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+
+        pending, self._pending = self._pending, []
+        if pending:
+            try:
+                await db_manager.execute_many(self.INSERT_QUOTE_QUERY, pending)
+            except Exception:
+                # Keep the quotes for the next flush, ahead of newer ones
+                self._pending[:0] = pending
+                raise
+
     async def get_recent_quotes(
         self, symbol_dst: str, limit: int = 100
     ) -> list[dict[str, Any]]:
@@ -65,8 +181,9 @@ class QuoteRepository:
         LIMIT ?
         """
 
-        rows = await db_manager.fetch_all(query, (symbol_dst, limit))
-        return [dict(row) for row in rows]
+        # Buffered quotes are written first so they are part of the result
+        await self.flush()
+        return await db_manager.fetch_all_dicts(query, (symbol_dst, limit))
 
 
 class OrderRepository:
@@ -91,12 +208,10 @@ class OrderRepository:
             order_data.get("status", "pending"),
         )
 
+        # The order_created outbox event is written by the tr_order_created_outbox
+        # trigger, in the same statement as the order
         order_id = await db_manager.execute(query, params)
-
-        # Publish order created event to outbox
-        await self._publish_order_event(
-            "order_created", order_data["order_id"], order_data
-        )
+        outbox_repo.notify_event_added()
 
         logger.info(
             "Created order record",
@@ -105,6 +220,23 @@ class OrderRepository:
         )
         return order_id
 
+    # One fixed statement for every combination of optional fields, so it is
+    # prepared once per connection. Parameters: (status, deltadefi_order_id,
+    # tx_hex, signed_tx, tx_hash, error_message, order_id); empty or NULL
+    # values keep the stored column.
+    UPDATE_STATUS_QUERY = """
+    UPDATE orders SET
+        status = ?1,
+        last_updated = unixepoch(),
+        deltadefi_order_id = COALESCE(NULLIF(?2, ''), deltadefi_order_id),
+        tx_hex = COALESCE(NULLIF(?3, ''), tx_hex),
+        signed_tx = COALESCE(NULLIF(?4, ''), signed_tx),
+        tx_hash = COALESCE(NULLIF(?5, ''), tx_hash),
+        error_message = COALESCE(NULLIF(?6, ''), error_message),
+        submitted_at = CASE WHEN ?1 = 'submitted' THEN unixepoch() ELSE submitted_at END
+    WHERE order_id = ?7
+    """
+
     async def update_order_status(
         self,
         order_id: str,
@@ -116,50 +248,28 @@ class OrderRepository:
         error_message: str | None = None,
     ) -> None:
         """Update order status and related fields"""
-
-        # Build dynamic update query
-        updates = ["status = ?", "last_updated = unixepoch()"]
-        params = [status]
-
-        if deltadefi_order_id:
-            updates.append("deltadefi_order_id = ?")
-            params.append(deltadefi_order_id)
-
-        if tx_hex:
-            updates.append("tx_hex = ?")
-            params.append(tx_hex)
-
-        if signed_tx:
-            updates.append("signed_tx = ?")
-            params.append(signed_tx)
-
-        if tx_hash:
-            updates.append("tx_hash = ?")
-            params.append(tx_hash)
-
-        if error_message:
-            updates.append("error_message = ?")
-            params.append(error_message)
-
-        if status == "submitted":
-            updates.append("submitted_at = unixepoch()")
-
-        params.append(order_id)  # WHERE clause
-
-        query = f"UPDATE orders SET {', '.join(updates)} WHERE order_id = ?"
-        await db_manager.execute(query, tuple(params))
-
-        # Publish order status event
-        await self._publish_order_event(
-            "order_status_updated",
+        params = (
+            status,
+            deltadefi_order_id,
+            tx_hex,
+            signed_tx,
+            tx_hash,
+            error_message,
             order_id,
-            {
-                "status": status,
-                "deltadefi_order_id": deltadefi_order_id,
-                "tx_hash": tx_hash,
-                "error_message": error_message,
-            },
         )
+        # Unset fields are left out of the event; handlers read them with .get()
+        payload: dict[str, Any] = {"status": status}
+        if deltadefi_order_id is not None:
+            payload["deltadefi_order_id"] = deltadefi_order_id
+        if tx_hash is not None:
+            payload["tx_hash"] = tx_hash
+        if error_message is not None:
+            payload["error_message"] = error_message
+
+        async with db_manager.transaction(immediate=True) as conn:
+            await conn.execute(self.UPDATE_STATUS_QUERY, params)
+            await _publish_event(conn, "order_status_updated", order_id, payload)
+        outbox_repo.notify_event_added()
 
         logger.info(
             "Updated order status",
@@ -178,14 +288,15 @@ class OrderRepository:
         WHERE order_id = ?
         """
 
-        await db_manager.execute(query, (filled_quantity, avg_fill_price, order_id))
-
-        # Publish fill event
-        await self._publish_order_event(
-            "order_filled",
-            order_id,
-            {"filled_quantity": filled_quantity, "avg_fill_price": avg_fill_price},
-        )
+        async with db_manager.transaction(immediate=True) as conn:
+            await conn.execute(query, (filled_quantity, avg_fill_price, order_id))
+            await _publish_event(
+                conn,
+                "order_filled",
+                order_id,
+                {"filled_quantity": filled_quantity, "avg_fill_price": avg_fill_price},
+            )
+        outbox_repo.notify_event_added()
 
         logger.info(
             "Updated order fill",
@@ -211,23 +322,7 @@ class OrderRepository:
             query += " WHERE symbol = ?"
             params = (symbol,)
 
-        rows = await db_manager.fetch_all(query, params)
-        return [dict(row) for row in rows]
-
-    async def _publish_order_event(
-        self, event_type: str, order_id: str, payload: dict[str, Any]
-    ) -> None:
-        """Publish order event to outbox"""
-        event_id = str(uuid.uuid4())
-
-        query = """
-        INSERT INTO outbox (event_id, event_type, aggregate_id, payload)
-        VALUES (?, ?, ?, ?)
-        """
-
-        await db_manager.execute(
-            query, (event_id, event_type, order_id, json.dumps(payload))
-        )
+        return await db_manager.fetch_all_dicts(query, params)
 
 
 class FillRepository:
@@ -256,10 +351,11 @@ class FillRepository:
             fill_data.get("is_maker", True),
         )
 
-        fill_id = await db_manager.execute(query, params)
-
-        # Publish fill event
-        await self._publish_fill_event("fill_created", fill_data["order_id"], fill_data)
+        async with db_manager.transaction(immediate=True) as conn:
+            cursor = await conn.execute(query, params)
+            fill_id = cursor.lastrowid
+            await _publish_event(conn, "fill_created", fill_data["order_id"], fill_data)
+        outbox_repo.notify_event_added()
 
         logger.info(
             "Created fill record",
@@ -272,8 +368,7 @@ class FillRepository:
     async def get_fills_for_order(self, order_id: str) -> list[dict[str, Any]]:
         """Get all fills for an order"""
         query = "SELECT * FROM fills WHERE order_id = ? ORDER BY executed_at"
-        rows = await db_manager.fetch_all(query, (order_id,))
-        return [dict(row) for row in rows]
+        return await db_manager.fetch_all_dicts(query, (order_id,))
 
     async def get_recent_fills(
         self, symbol: str | None = None, limit: int = 100
@@ -289,23 +384,7 @@ class FillRepository:
         query += " ORDER BY executed_at DESC LIMIT ?"
         params = (*params, limit)
 
-        rows = await db_manager.fetch_all(query, params)
-        return [dict(row) for row in rows]
-
-    async def _publish_fill_event(
-        self, event_type: str, order_id: str, payload: dict[str, Any]
-    ) -> None:
-        """Publish fill event to outbox"""
-        event_id = str(uuid.uuid4())
-
-        query = """
-        INSERT INTO outbox (event_id, event_type, aggregate_id, payload)
-        VALUES (?, ?, ?, ?)
-        """
-
-        await db_manager.execute(
-            query, (event_id, event_type, order_id, json.dumps(payload))
-        )
+        return await db_manager.fetch_all_dicts(query, params)
 
 
 class PositionRepository:
@@ -320,8 +399,20 @@ class PositionRepository:
     async def get_all_positions(self) -> list[dict[str, Any]]:
         """Get all current positions"""
         query = "SELECT * FROM positions WHERE quantity != 0"
-        rows = await db_manager.fetch_all(query)
-        return [dict(row) for row in rows]
+        return await db_manager.fetch_all_dicts(query)
+
+    # Upsert in place: keeps the row's id, created_at and metrics columns, and
+    # a NULL realized_pnl (?4) keeps the stored value
+    UPSERT_POSITION_QUERY = """
+    INSERT INTO positions (
+        symbol, quantity, avg_entry_price, realized_pnl, last_updated
+    ) VALUES (?1, ?2, ?3, COALESCE(?4, 0), unixepoch())
+    ON CONFLICT(symbol) DO UPDATE SET
+        quantity = excluded.quantity,
+        avg_entry_price = excluded.avg_entry_price,
+        realized_pnl = COALESCE(?4, realized_pnl),
+        last_updated = excluded.last_updated
+    """
 
     async def update_position(
         self,
@@ -331,14 +422,9 @@ class PositionRepository:
         realized_pnl: float | None = None,
     ) -> None:
         """Update position information"""
-        query = """
-        INSERT OR REPLACE INTO positions (
-            symbol, quantity, avg_entry_price, realized_pnl, last_updated
-        ) VALUES (?, ?, ?, COALESCE(?, (SELECT realized_pnl FROM positions WHERE symbol = ?)), unixepoch())
-        """
-
         await db_manager.execute(
-            query, (symbol, quantity, avg_entry_price, realized_pnl, symbol)
+            self.UPSERT_POSITION_QUERY,
+            (symbol, quantity, avg_entry_price, realized_pnl),
         )
 
         logger.info(
@@ -352,17 +438,24 @@ class PositionRepository:
 class BalanceRepository:
     """Repository for account balance tracking"""
 
+    UPSERT_BALANCE_QUERY = """
+    INSERT INTO account_balances (
+        asset, available, locked, total, updated_at
+    ) VALUES (?, ?, ?, ?, unixepoch())
+    ON CONFLICT(asset) DO UPDATE SET
+        available = excluded.available,
+        locked = excluded.locked,
+        total = excluded.total,
+        updated_at = excluded.updated_at
+    """
+
     async def update_balance(self, asset: str, available: float, locked: float) -> None:
         """Update account balance"""
         total = available + locked
 
-        query = """
-        INSERT OR REPLACE INTO account_balances (
-            asset, available, locked, total, updated_at
-        ) VALUES (?, ?, ?, ?, unixepoch())
-        """
-
-        await db_manager.execute(query, (asset, available, locked, total))
+        await db_manager.execute(
+            self.UPSERT_BALANCE_QUERY, (asset, available, locked, total)
+        )
 
         logger.info(
             "Updated balance",
@@ -381,61 +474,214 @@ class BalanceRepository:
     async def get_all_balances(self) -> list[dict[str, Any]]:
         """Get all account balances"""
         query = "SELECT * FROM account_balances WHERE total > 0"
-        rows = await db_manager.fetch_all(query)
-        return [dict(row) for row in rows]
+        return await db_manager.fetch_all_dicts(query)
 
 
 class OutboxRepository:
     """Repository for outbox pattern event management"""
 
+    def __init__(self) -> None:
+        # Callbacks run after an event is written, e.g. to wake the worker
+        self._listeners: list[Callable[[], None]] = []
+
+    def add_listener(self, callback: Callable[[], None]) -> None:
+        """Register a callback to run whenever an event is added"""
+        self._listeners.append(callback)
+
+    def remove_listener(self, callback: Callable[[], None]) -> None:
+        """Unregister a callback added with add_listener"""
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def notify_event_added(self) -> None:
+        """Tell listeners that new events are waiting"""
+        for callback in self._listeners:
+            callback()
+
+    # IDs of the next ?1 events due for processing, oldest first. Each status is
+    # read through its own index and merged; a single OR condition would make
+    # SQLite walk the created_at index across every completed event.
+    DUE_EVENT_IDS_QUERY = """
+    SELECT id FROM (
+        SELECT * FROM (
+            SELECT id, created_at FROM outbox
+            WHERE status = 'pending'
+            ORDER BY created_at LIMIT ?1
+        )
+        UNION ALL
+        SELECT * FROM (
+            SELECT id, created_at FROM outbox
+            WHERE status = 'failed' AND next_retry_at <= unixepoch()
+            ORDER BY created_at LIMIT ?1
+        )
+    )
+    ORDER BY created_at
+    LIMIT ?1
+    """
+
+    PENDING_EVENTS_QUERY = f"""
+    SELECT * FROM outbox
+    WHERE id IN ({DUE_EVENT_IDS_QUERY})
+    ORDER BY created_at
+    """
+
+    # One statement selects, claims and returns the batch, so a claimed event
+    # can never be fetched by a second reader. Event types in the JSON array
+    # ?2 need no handling beyond a log line and are completed outright.
+    CLAIM_EVENTS_QUERY = f"""
+    UPDATE outbox SET
+        status = CASE WHEN event_type IN (SELECT value FROM json_each(?2))
+            THEN 'completed' ELSE 'processing' END,
+        processed_at = CASE WHEN event_type IN (SELECT value FROM json_each(?2))
+            THEN unixepoch() ELSE processed_at END
+    WHERE id IN ({DUE_EVENT_IDS_QUERY})
+    RETURNING *
+    """
+
     async def get_pending_events(self, limit: int = 100) -> list[dict[str, Any]]:
         """Get pending events for processing"""
-        query = """
-        SELECT * FROM outbox
-        WHERE status = 'pending'
-           OR (status = 'failed' AND next_retry_at <= unixepoch())
-        ORDER BY created_at
-        LIMIT ?
+        return await db_manager.fetch_all_dicts(self.PENDING_EVENTS_QUERY, (limit,))
+
+    async def claim_pending_events(
+        self, limit: int = 100, complete_types: Collection[str] = ()
+    ) -> list[dict[str, Any]]:
+        """
+        Mark the next batch of pending events as processing and return them
+
+        Events whose type is in ``complete_types`` are marked completed instead,
+        saving a second write for events that only need to be logged.
         """
+        params = (limit, _dumps_json(list(complete_types)))
+        async with db_manager.transaction(immediate=True) as conn:
+            with dict_rows(conn):
+                events: list[dict[str, Any]] = list(
+                    await conn.execute_fetchall(self.CLAIM_EVENTS_QUERY, params)  # type: ignore[arg-type]
+                )
+
+        # RETURNING does not preserve the subquery order
+        events.sort(key=lambda event: (event["created_at"], event["id"]))
+        return events
+
+    async def release_events(self, event_ids: list[str]) -> None:
+        """Return claimed events that were never handled to the pending state"""
+        if not event_ids:
+            return
 
-        rows = await db_manager.fetch_all(query, (limit,))
-        return [dict(row) for row in rows]
+        query = """
+        UPDATE outbox SET status = 'pending'
+        WHERE status = 'processing' AND event_id IN (SELECT value FROM json_each(?))
+        """
+        await db_manager.execute(query, (_dumps_json(event_ids),))
+
+    MARK_COMPLETED_QUERY = """
+    UPDATE outbox
+    SET status = 'completed', processed_at = unixepoch()
+    WHERE event_id = ?
+    """
+
+    # Parameter: JSON array of event IDs, so one fixed statement covers a batch
+    MARK_COMPLETED_BATCH_QUERY = """
+    UPDATE outbox
+    SET status = 'completed', processed_at = unixepoch()
+    WHERE event_id IN (SELECT value FROM json_each(?))
+    """
+
+    # Parameters: (error_message, retry_delay_seconds, event_id)
+    MARK_FAILED_QUERY = """
+    UPDATE outbox
+    SET status = CASE
+            WHEN retry_count >= max_retries THEN 'dead_letter'
+            ELSE 'failed'
+        END,
+        retry_count = retry_count + 1,
+        error_message = ?,
+        last_error_at = unixepoch(),
+        next_retry_at = CASE
+            WHEN retry_count >= max_retries THEN NULL
+            ELSE unixepoch() + ?
+        END
+    WHERE event_id = ?
+    """
+
+    # Parameter: JSON array of [event_id, error_message, retry_delay_seconds]
+    MARK_FAILED_BATCH_QUERY = """
+    WITH failure AS (
+        SELECT
+            json_extract(value, '$[0]') AS event_id,
+            json_extract(value, '$[1]') AS error_message,
+            json_extract(value, '$[2]') AS retry_delay
+        FROM json_each(?)
+    )
+    UPDATE outbox
+    SET status = CASE
+            WHEN retry_count >= max_retries THEN 'dead_letter'
+            ELSE 'failed'
+        END,
+        retry_count = retry_count + 1,
+        error_message = failure.error_message,
+        last_error_at = unixepoch(),
+        next_retry_at = CASE
+            WHEN retry_count >= max_retries THEN NULL
+            ELSE unixepoch() + failure.retry_delay
+        END
+    FROM failure
+    WHERE outbox.event_id = failure.event_id
+    """
 
     async def mark_event_processing(self, event_id: str) -> None:
         """Mark event as being processed"""
         query = "UPDATE outbox SET status = 'processing' WHERE event_id = ?"
         await db_manager.execute(query, (event_id,))
 
-    async def mark_event_completed(self, event_id: str) -> None:
-        """Mark event as completed"""
+    async def mark_events_processing(self, event_ids: list[str]) -> None:
+        """Mark a batch of events as being processed in a single statement"""
+        if not event_ids:
+            return
+
+        # Bind the IDs as one JSON array so the SQL text (and its cached
+        # prepared statement) is the same for every batch size
         query = """
-        UPDATE outbox
-        SET status = 'completed', processed_at = unixepoch()
-        WHERE event_id = ?
+        UPDATE outbox SET status = 'processing'
+        WHERE event_id IN (SELECT value FROM json_each(?))
         """
-        await db_manager.execute(query, (event_id,))
+        await db_manager.execute(query, (_dumps_json(event_ids),))
+
+    async def mark_event_completed(self, event_id: str) -> None:
+        """Mark event as completed"""
+        await db_manager.execute(self.MARK_COMPLETED_QUERY, (event_id,))
 
     async def mark_event_failed(
         self, event_id: str, error_message: str, retry_delay_seconds: int = 60
     ) -> None:
         """Mark event as failed and schedule retry"""
-        query = """
-        UPDATE outbox
-        SET status = CASE
-                WHEN retry_count >= max_retries THEN 'dead_letter'
-                ELSE 'failed'
-            END,
-            retry_count = retry_count + 1,
-            error_message = ?,
-            last_error_at = unixepoch(),
-            next_retry_at = CASE
-                WHEN retry_count >= max_retries THEN NULL
-                ELSE unixepoch() + ?
-            END
-        WHERE event_id = ?
+        await db_manager.execute(
+            self.MARK_FAILED_QUERY, (error_message, retry_delay_seconds, event_id)
+        )
+
+    async def mark_events_results(
+        self,
+        completed_ids: list[str],
+        failures: list[tuple[str, str, int]],
+    ) -> None:
         """
+        Record a batch of event outcomes in one transaction
 
-        await db_manager.execute(query, (error_message, retry_delay_seconds, event_id))
+        Args:
+            completed_ids: Event IDs to mark completed
+            failures: (event_id, error_message, retry_delay_seconds) to schedule retry
+        """
+        if not completed_ids and not failures:
+            return
+
+        async with db_manager.transaction(immediate=True) as conn:
+            if completed_ids:
+                await conn.execute(
+                    self.MARK_COMPLETED_BATCH_QUERY, (_dumps_json(completed_ids),)
+                )
+            if failures:
+                await conn.execute(
+                    self.MARK_FAILED_BATCH_QUERY, (_dumps_json(failures),)
+                )
 
     async def add_event(
         self,
@@ -445,10 +691,7 @@ class OutboxRepository:
         max_retries: int = 5,
     ) -> str:
         """Add a new event to the outbox"""
-        import json
-        import uuid
-
-        event_id = str(uuid.uuid4())
+        event_id = secrets.token_hex(16)
 
         query = """
         INSERT INTO outbox (
@@ -459,8 +702,9 @@ class OutboxRepository:
 
         await db_manager.execute(
             query,
-            (event_id, event_type, aggregate_id, json.dumps(payload), max_retries),
+            (event_id, event_type, aggregate_id, _dumps_payload(payload), max_retries),
         )
+        self.notify_event_added()
 
         return event_id
 
@@ -479,7 +723,7 @@ class TradingSessionRepository:
         params = (
             session_data["session_id"],
             session_data["started_at"],
-            json.dumps(session_data["config_snapshot"]),
+            _dumps_json(session_data["config_snapshot"]),
             session_data.get("status", "active"),
         )
 
@@ -4,9 +4,13 @@ SQLite connection manager with WAL mode, migrations, and connection pooling
 
 import asyncio
 from collections.abc import AsyncGenerator, Generator
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager, contextmanager
+from operator import itemgetter
 from pathlib import Path
 import sqlite3
+import threading
+import time
 from typing import Any
 
 import aiosqlite
@@ -25,6 +29,109 @@ class MigrationError(DatabaseError):
     """Exception raised during database migrations"""
 
 
+# Per-connection tuning for the write-heavy outbox workload. journal_mode=WAL is
+# persistent in the database file and is set once in initialize().
+CONNECTION_PRAGMAS = (
+    "PRAGMA foreign_keys=ON",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=10000",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA wal_autocheckpoint=1000",
+    # Truncate the WAL back to 64 MB after checkpoints instead of letting it
+    # keep its high-water size
+    "PRAGMA journal_size_limit=67108864",
+    "PRAGMA busy_timeout=5000",
+)
+
+# Page size for new database files; it only takes effect before the first
+# table is created, so existing databases keep theirs
+PAGE_SIZE = 8192
+
+
+# Prepared statements kept per connection by the sqlite3 module, keyed by SQL
+# text; sized to hold every fixed query the repositories issue
+STATEMENT_CACHE_SIZE = 256
+
+
+# Most queued writes the writer task commits in one transaction
+WRITE_BATCH_SIZE = 100
+
+# A queued write: (query, parameters, executemany?, result future)
+_Write = tuple[str, Any, bool, "asyncio.Future[Any]"]
+
+
+# First field of each cursor.description entry
+_column_name = itemgetter(0)
+
+
+def _dict_row(cursor: sqlite3.Cursor, row: tuple[Any, ...]) -> dict[str, Any]:
+    """Row factory building plain dicts directly, without a Row object first"""
+    return dict(zip(map(_column_name, cursor.description), row, strict=True))
+
+
+@contextmanager
+def dict_rows(
+    conn: aiosqlite.Connection,
+) -> Generator[aiosqlite.Connection, None, None]:
+    """Have a checked-out connection return dict rows for the duration"""
+    conn.row_factory = _dict_row  # type: ignore[assignment]
+    try:
+        yield conn
+    finally:
+        conn.row_factory = aiosqlite.Row
+
+
+# Indexes ensured on every startup, so databases created from an older
+# schema.sql pick them up too (schema.sql is only applied to new databases)
+INDEXES = (
+    "CREATE INDEX IF NOT EXISTS idx_outbox_status_created"
+    " ON outbox(status, created_at)",
+    "CREATE INDEX IF NOT EXISTS idx_outbox_status_processed"
+    " ON outbox(status, processed_at)",
+    "CREATE INDEX IF NOT EXISTS idx_outbox_status_retry ON outbox(status, retry_count)",
+    # Partial indexes for the poller: only rows it can pick up are indexed
+    "CREATE INDEX IF NOT EXISTS idx_outbox_pending"
+    " ON outbox(created_at) WHERE status = 'pending'",
+    "CREATE INDEX IF NOT EXISTS idx_outbox_retry_due"
+    " ON outbox(next_retry_at) WHERE status = 'failed'",
+    # Active orders only, by symbol: v_active_orders lookups touch the few
+    # open orders instead of scanning the order history. The WHERE matches
+    # the view's filter so the planner can use it.
+    "CREATE INDEX IF NOT EXISTS idx_orders_active ON orders(symbol)"
+    " WHERE status IN ('idle', 'pending', 'working', 'submitted', 'partially_filled')",
+)
+
+# Triggers ensured on every startup, like INDEXES. New orders write their
+# order_created outbox event from within the INSERT, so creating an order is a
+# single statement that commits atomically with its event.
+TRIGGERS = (
+    """
+    CREATE TRIGGER IF NOT EXISTS tr_order_created_outbox
+    AFTER INSERT ON orders
+    FOR EACH ROW
+    BEGIN
+        INSERT INTO outbox (event_id, event_type, aggregate_id, payload)
+        VALUES (
+            lower(hex(randomblob(16))),
+            'order_created',
+            NEW.order_id,
+            json_object(
+                'order_id', NEW.order_id,
+                'quote_id', NEW.quote_id,
+                'symbol', NEW.symbol,
+                'side', NEW.side,
+                'order_type', NEW.order_type,
+                'price', NEW.price,
+                'quantity', NEW.quantity,
+                'status', NEW.status
+            )
+        );
+    END
+    """,
+)
+
+
 class SQLiteManager:
     """
     SQLite database manager with connection pooling and migrations
@@ -37,12 +144,31 @@ class SQLiteManager:
     - Foreign key enforcement
     """
 
-    def __init__(self, db_path: str | None = None):
+    def __init__(self, db_path: str | None = None, wal2: bool | None = None):
         self.db_path = Path(db_path or settings.system.db_path)
+        self.wal2 = settings.system.sqlite_wal2 if wal2 is None else wal2
         self.schema_path = Path(__file__).parent / "schema.sql"
         self._connection_pool: list[aiosqlite.Connection] = []
         self._pool_lock = asyncio.Lock()
         self._initialized = False
+        self.journal_mode = "memory" if self.is_memory else "wal"
+        self.batch_atomic_write = False
+
+        # Group commit: execute() writes queue for one writer task that
+        # commits everything queued so far together (None stops the task)
+        self._write_queue: asyncio.Queue[_Write | None] | None = None
+        self._writer_task: asyncio.Task[None] | None = None
+
+        # One cached sync_connection() connection per calling thread; all of
+        # them are listed so close() can reach them
+        self._sync_local = threading.local()
+        self._sync_connections: list[sqlite3.Connection] = []
+
+        # get_table_info results; the schema only changes in _run_migrations
+        self._schema_cache: dict[str, list[aiosqlite.Row]] = {}
+
+        # (time.monotonic() when taken, get_database_size result)
+        self._size_cache: tuple[float, dict[str, Any]] | None = None
 
     async def initialize(self) -> None:
         """Initialize the database with schema and optimizations"""
@@ -57,16 +183,16 @@ class SQLiteManager:
         # Create and configure database
         async with aiosqlite.connect(self.db_path) as conn:
             # Enable WAL mode for better concurrency
-            await conn.execute("PRAGMA journal_mode=WAL")
-            await conn.execute("PRAGMA synchronous=NORMAL")
-            await conn.execute("PRAGMA cache_size=10000")
-            await conn.execute("PRAGMA temp_store=memory")
-
-            # Enable foreign keys
-            await conn.execute("PRAGMA foreign_keys=ON")
+            if not self.is_memory:
+                await conn.execute(f"PRAGMA page_size={PAGE_SIZE}")
+                self.journal_mode = await self._enable_wal(conn)
+            await self._detect_capabilities(conn)
+            await self._configure_connection(conn)
 
             # Run schema migrations
             await self._run_migrations(conn)
+            await self._ensure_indexes(conn)
+            await self._ensure_triggers(conn)
 
             await conn.commit()
 
@@ -96,6 +222,7 @@ class SQLiteManager:
 
             # If quotes table doesn't exist (empty columns) or has wrong schema, apply schema
             if not columns or not has_quote_id:
+                self._schema_cache.clear()
                 logger.info(
                     "Applying database schema",
                     has_existing_tables=bool(columns),
@@ -190,6 +317,89 @@ class SQLiteManager:
         except Exception as e:
             raise MigrationError(f"Migration failed: {e}") from e
 
+    async def _enable_wal(self, conn: aiosqlite.Connection) -> str:
+        """Switch to WAL, or to wal2 when enabled and the build supports it"""
+        # Stock SQLite ignores an unknown journal mode and reports the current
+        # one, so the returned mode says whether wal2 took effect
+        for mode in ("wal2", "wal") if self.wal2 else ("wal",):
+            cursor = await conn.execute(f"PRAGMA journal_mode={mode}")
+            row = await cursor.fetchone()
+            await cursor.close()
+            if row and row[0].lower() == mode:
+                return mode
+            if mode == "wal2":
+                logger.info("wal2 journal mode not supported, using WAL")
+        return str(row[0]).lower() if row else "unknown"
+
+    async def _detect_capabilities(self, conn: aiosqlite.Connection) -> None:
+        """Record SQLite build options that affect the commit path"""
+        cursor = await conn.execute(
+            "SELECT 1 FROM pragma_compile_options()"
+            " WHERE compile_options = 'ENABLE_BATCH_ATOMIC_WRITE'"
+        )
+        # With batch atomic write, SQLite skips the rollback journal on
+        # devices whose VFS reports atomic batch writes; nothing to enable
+        self.batch_atomic_write = await cursor.fetchone() is not None
+        await cursor.close()
+
+        logger.info(
+            "SQLite capabilities",
+            sqlite_version=sqlite3.sqlite_version,
+            journal_mode=self.journal_mode,
+            batch_atomic_write=self.batch_atomic_write,
+        )
+
+    async def _ensure_triggers(self, conn: aiosqlite.Connection) -> None:
+        """Create triggers missing from existing databases"""
+        for sql in TRIGGERS:
+            await conn.execute(sql)
+
+    async def _ensure_indexes(self, conn: aiosqlite.Connection) -> None:
+        """Create workload indexes missing from existing databases"""
+        for sql in INDEXES:
+            await conn.execute(sql)
+
+        # Refresh planner statistics so the new indexes get picked up
+        await conn.execute("ANALYZE outbox")
+
+    @property
+    def is_memory(self) -> bool:
+        """Whether this manager points at an in-memory database"""
+        return str(self.db_path) == ":memory:"
+
+    async def _configure_connection(self, conn: aiosqlite.Connection) -> None:
+        """Apply per-connection PRAGMAs"""
+        if self.is_memory:
+            # WAL/mmap tuning does not apply to in-memory databases
+            await conn.execute("PRAGMA foreign_keys=ON")
+            return
+
+        for pragma in CONNECTION_PRAGMAS:
+            await conn.execute(pragma)
+
+    async def _open_connection(self) -> aiosqlite.Connection:
+        """Open and configure a new pooled connection"""
+        conn = await aiosqlite.connect(
+            self.db_path, cached_statements=STATEMENT_CACHE_SIZE
+        )
+        conn.row_factory = aiosqlite.Row
+
+        # Configure connection
+        await self._configure_connection(conn)
+        return conn
+
+    async def warm_pool(self, size: int = 2) -> None:
+        """Pre-open pooled connections (safe to run alongside initialize())"""
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conns = await asyncio.gather(*(self._open_connection() for _ in range(size)))
+
+        async with self._pool_lock:
+            for conn in conns:
+                if len(self._connection_pool) < 10:  # Max pool size
+                    self._connection_pool.append(conn)
+                else:
+                    await conn.close()
+
     @asynccontextmanager
     async def get_connection(self) -> AsyncGenerator[aiosqlite.Connection, None]:
         """Get a database connection from the pool"""
@@ -200,11 +410,7 @@ class SQLiteManager:
             if self._connection_pool:
                 conn = self._connection_pool.pop()
             else:
-                conn = await aiosqlite.connect(self.db_path)
-                conn.row_factory = aiosqlite.Row
-
-                # Configure connection
-                await conn.execute("PRAGMA foreign_keys=ON")
+                conn = await self._open_connection()
 
         try:
             yield conn
@@ -220,11 +426,19 @@ class SQLiteManager:
                 await conn.close()
 
     @asynccontextmanager
-    async def transaction(self) -> AsyncGenerator[aiosqlite.Connection, None]:
-        """Get a database connection within a transaction"""
+    async def transaction(
+        self, immediate: bool = False
+    ) -> AsyncGenerator[aiosqlite.Connection, None]:
+        """
+        Get a database connection within a transaction
+
+        With ``immediate`` the write lock is taken up front (BEGIN IMMEDIATE),
+        so a write transaction waits for the lock instead of failing with
+        SQLITE_BUSY when it upgrades from a read after another commit
+        """
         async with self.get_connection() as conn:
             try:
-                await conn.execute("BEGIN")
+                await conn.execute("BEGIN IMMEDIATE" if immediate else "BEGIN")
                 yield conn
                 await conn.commit()
             except Exception:
@@ -238,24 +452,174 @@ class SQLiteManager:
         fetch_one: bool = False,
         fetch_all: bool = False,
     ) -> Any:
-        """Execute a single query"""
+        """
+        Execute a single query
+
+        A write returns its lastrowid, or its first row when the statement has
+        a RETURNING clause.
+        """
+        if not (fetch_one or fetch_all or self.is_memory):
+            return await self._write(query, parameters, many=False)
+
+        # Reads run in autocommit mode: no BEGIN/COMMIT, and WAL gives each
+        # statement its own consistent snapshot
         async with self.get_connection() as conn:
+            if fetch_all or fetch_one:
+                # One hop to the connection thread instead of execute + fetch.
+                # The statement also runs to completion, so no read snapshot is
+                # left open on the pooled connection; fetch_one queries select
+                # a single row (unique key or LIMIT 1).
+                rows = await conn.execute_fetchall(query, parameters)
+                if fetch_all:
+                    return list(rows)
+                return next(iter(rows), None)
+
             cursor = await conn.execute(query, parameters)
 
-            if fetch_one:
-                return await cursor.fetchone()
-            elif fetch_all:
-                return await cursor.fetchall()
-            else:
-                await conn.commit()
-                return cursor.lastrowid
+            # RETURNING rows must be read before the commit
+            row = await cursor.fetchone() if cursor.description else None
+            await conn.commit()
+            return row if cursor.description else cursor.lastrowid
 
     async def execute_many(self, query: str, parameters_list: list[tuple]) -> None:
         """Execute query with multiple parameter sets"""
+        if not self.is_memory:
+            await self._write(query, parameters_list, many=True)
+            return
+
         async with self.get_connection() as conn:
             await conn.executemany(query, parameters_list)
             await conn.commit()
 
+    async def _write(self, query: str, parameters: Any, many: bool) -> Any:
+        """Queue a write for the writer task; returns once it is committed"""
+        if not self._initialized:
+            await self.initialize()
+
+        loop = asyncio.get_running_loop()
+        task = self._writer_task
+        if task is None or task.done() or task.get_loop() is not loop:
+            self._write_queue = asyncio.Queue()
+            self._writer_task = loop.create_task(self._run_writer(self._write_queue))
+
+        future: asyncio.Future[Any] = loop.create_future()
+        self._write_queue.put_nowait((query, parameters, many, future))  # type: ignore[union-attr]
+        return await future
+
+    async def _run_writer(self, queue: asyncio.Queue[_Write | None]) -> None:
+        """
+        Commit queued writes in groups on one dedicated connection
+
+        The writer uses a plain sqlite3 connection on its own single thread, so
+        a whole group costs one thread hop instead of one per statement
+        """
+        loop = asyncio.get_running_loop()
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sqlite-writer")
+        conn: sqlite3.Connection | None = None
+        batch: list[_Write] = []
+        error: Exception = RuntimeError("Database writer stopped")
+        try:
+            conn = await loop.run_in_executor(executor, self._open_writer_connection)
+            while True:
+                item = await queue.get()
+                batch = []
+                while item is not None:
+                    batch.append(item)
+                    if len(batch) >= WRITE_BATCH_SIZE or queue.empty():
+                        break
+                    item = queue.get_nowait()
+
+                if batch:
+                    writes = [(query, params, many) for query, params, many, _ in batch]
+                    results = await loop.run_in_executor(
+                        executor, self._apply_writes, conn, writes
+                    )
+                    for (*_, future), result in zip(batch, results, strict=True):
+                        if future.done():  # Caller cancelled; the write still happened
+                            continue
+                        if isinstance(result, Exception):
+                            future.set_exception(result)
+                        else:
+                            future.set_result(result)
+                    batch = []
+                if item is None:
+                    break
+        except Exception as e:
+            logger.error("Database writer failed", error=str(e))
+            error = e
+        finally:
+            if conn is not None:
+                await loop.run_in_executor(executor, conn.close)
+            executor.shutdown(wait=False)
+
+        # Fail every caller still waiting instead of leaving it queued forever;
+        # the next write starts a fresh writer
+        while not queue.empty():
+            pending = queue.get_nowait()
+            if pending is not None:
+                batch.append(pending)
+        for *_, future in batch:
+            if not future.done():
+                future.set_exception(error)
+
+    def _open_writer_connection(self) -> sqlite3.Connection:
+        """Open the writer's connection (runs on the writer thread)"""
+        # Autocommit mode: transactions are only the ones _apply_writes opens
+        conn = sqlite3.connect(
+            self.db_path, isolation_level=None, cached_statements=STATEMENT_CACHE_SIZE
+        )
+        for pragma in CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        # Same row type as the pooled connections, for RETURNING rows
+        conn.row_factory = aiosqlite.Row
+        return conn
+
+    @staticmethod
+    def _apply_writes(
+        conn: sqlite3.Connection, writes: list[tuple[str, Any, bool]]
+    ) -> list[Any]:
+        """Run a group of writes in one transaction (runs on the writer thread)"""
+        results: list[Any] = []
+        try:
+            # A lone statement simply autocommits; an executemany still needs
+            # a transaction, or each row would commit on its own
+            if len(writes) > 1 or writes[0][2]:
+                conn.execute("BEGIN IMMEDIATE")
+            for query, parameters, many in writes:
+                # Each write gets its own savepoint, so a failure undoes all of
+                # that write (every row of an executemany) and nothing else
+                if conn.in_transaction:
+                    conn.execute("SAVEPOINT write")
+                try:
+                    if many:
+                        cursor = conn.executemany(query, parameters)
+                    else:
+                        cursor = conn.execute(query, parameters)
+                    result = (
+                        cursor.fetchone() if cursor.description else cursor.lastrowid
+                    )
+                    cursor.close()  # Reset the statement before RELEASE
+                except sqlite3.Error as e:
+                    # Anything that ends the transaction fails the group
+                    if not conn.in_transaction:
+                        if len(writes) > 1:
+                            raise
+                    else:
+                        conn.execute("ROLLBACK TO write")
+                        conn.execute("RELEASE write")
+                    results.append(e)
+                else:
+                    if conn.in_transaction:
+                        conn.execute("RELEASE write")
+                    results.append(result)
+            if conn.in_transaction:
+                conn.execute("COMMIT")
+        except Exception as e:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            return [e] * len(writes)
+        return results
+
     async def fetch_one(
         self, query: str, parameters: tuple = ()
     ) -> aiosqlite.Row | None:
@@ -268,8 +632,23 @@ class SQLiteManager:
         """Fetch all rows"""
         return await self.execute(query, parameters, fetch_all=True)
 
+    async def fetch_all_dicts(
+        self, query: str, parameters: tuple = ()
+    ) -> list[dict[str, Any]]:
+        """Fetch all rows as plain dicts, for callers that would convert them"""
+        async with self.get_connection() as conn:
+            with dict_rows(conn):
+                return list(await conn.execute_fetchall(query, parameters))  # type: ignore[arg-type]
+
     async def close(self) -> None:
         """Close all connections in the pool"""
+        # Let the writer commit what is already queued, then stop it
+        task = self._writer_task
+        if task and not task.done() and task.get_loop() is asyncio.get_running_loop():
+            self._write_queue.put_nowait(None)  # type: ignore[union-attr]
+            await task
+        self._writer_task = self._write_queue = None
+
         async with self._pool_lock:
             for conn in self._connection_pool:
                 try:
@@ -279,22 +658,45 @@ class SQLiteManager:
 
             self._connection_pool.clear()
 
+        for sync_conn in self._sync_connections:
+            sync_conn.close()
+        self._sync_connections.clear()
+        self._sync_local = threading.local()
+
         logger.info("Database connections closed")
 
     @contextmanager
     def sync_connection(self) -> Generator[sqlite3.Connection, None, None]:
         """
         Get a synchronous connection for non-async contexts
+
+        Each thread reuses one connection, configured like the pooled ones.
         WARNING: Use sparingly, prefer async methods
         """
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        conn.execute("PRAGMA foreign_keys=ON")
+        conn: sqlite3.Connection | None = getattr(self._sync_local, "conn", None)
+        if conn is None:
+            # Only ever used from this thread; close() may run on another
+            conn = sqlite3.connect(
+                self.db_path,
+                check_same_thread=False,
+                cached_statements=STATEMENT_CACHE_SIZE,
+            )
+            conn.row_factory = sqlite3.Row
+            pragmas = (
+                ("PRAGMA foreign_keys=ON",) if self.is_memory else CONNECTION_PRAGMAS
+            )
+            for pragma in pragmas:
+                conn.execute(pragma)
+            self._sync_local.conn = conn
+            self._sync_connections.append(conn)
 
         try:
             yield conn
-        finally:
-            conn.close()
+        except BaseException:
+            # Do not leave a half-done transaction on the cached connection
+            if conn.in_transaction:
+                conn.rollback()
+            raise
 
     def execute_sync(
         self,
@@ -317,7 +719,17 @@ class SQLiteManager:
 
     async def get_table_info(self, table_name: str) -> list[aiosqlite.Row]:
         """Get table schema information"""
-        return await self.fetch_all("PRAGMA table_info(?)", (table_name,))
+        columns = self._schema_cache.get(table_name)
+        if columns is None:
+            # PRAGMA statements take no bound parameters; the table-valued
+            # form does
+            columns = await self.fetch_all(
+                "SELECT * FROM pragma_table_info(?)", (table_name,)
+            )
+            # A missing table is not cached, it may be created later
+            if columns:
+                self._schema_cache[table_name] = columns
+        return columns
 
     async def get_tables(self) -> list[str]:
         """Get all table names"""
@@ -333,27 +745,51 @@ class SQLiteManager:
             await conn.execute("VACUUM")
         logger.info("Database vacuum completed")
 
+    async def checkpoint(self) -> None:
+        """Checkpoint and truncate the WAL file"""
+        if self.is_memory:
+            return
+        async with self.get_connection() as conn:
+            await conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
     async def analyze(self) -> None:
         """Update database statistics for query optimization"""
         async with self.get_connection() as conn:
             await conn.execute("ANALYZE")
         logger.info("Database analysis completed")
 
+    # Size stats are polled by metrics endpoints; the file size does not
+    # move meaningfully within this many seconds
+    SIZE_CACHE_TTL = 10.0
+
+    DATABASE_SIZE_QUERY = """
+    SELECT
+        (SELECT page_count FROM pragma_page_count()) AS page_count,
+        (SELECT page_size FROM pragma_page_size()) AS page_size
+    """
+
     async def get_database_size(self) -> dict[str, Any]:
         """Get database size statistics"""
-        page_count = await self.fetch_one("PRAGMA page_count")
-        page_size = await self.fetch_one("PRAGMA page_size")
-
-        total_pages = page_count["page_count"] if page_count else 0
-        page_size_bytes = page_size["page_size"] if page_size else 0
+        now = time.monotonic()
+        cached = self._size_cache
+        if cached is not None and now - cached[0] < self.SIZE_CACHE_TTL:
+            return dict(cached[1])
+
+        row = await self.fetch_one(self.DATABASE_SIZE_QUERY)
+        total_pages = row["page_count"] if row else 0
+        page_size_bytes = row["page_size"] if row else 0
         total_size_bytes = total_pages * page_size_bytes
 
-        return {
+        size = {
             "total_size_mb": round(total_size_bytes / (1024 * 1024), 2),
             "total_pages": total_pages,
             "page_size_bytes": page_size_bytes,
             "file_path": str(self.db_path),
+            "journal_mode": self.journal_mode,
+            "batch_atomic_write": self.batch_atomic_write,
         }
+        self._size_cache = (now, size)
+        return dict(size)
 
 
 # Global database manager instance
@@ -9,6 +9,7 @@ This module provides:
 
 import asyncio
 from collections.abc import Callable
+import time
 from typing import Any
 
 from deltadefi import ApiClient
@@ -19,6 +20,60 @@ from bot.rate_limiter import TokenBucketRateLimiter
 
 logger = structlog.get_logger()
 
+# Account stream message types after which cached open orders are stale
+_ORDER_CHANGE_SUB_TYPES = frozenset(
+    {"order_update", "orderUpdate", "fill", "trade", "trading_history"}
+)
+
+
+def _extract_orders(result: Any) -> list[Any]:
+    """Orders from one get_order_records page, whatever its response shape"""
+    if hasattr(result, "data") and result.data:
+        # SDK response object with data attribute
+        data = result.data
+    elif isinstance(result, dict) and "data" in result:
+        # Dict response with nested structure
+        data = result["data"]
+    elif isinstance(result, list):
+        # Direct list of orders
+        return result
+    else:
+        logger.warning(
+            "Unexpected response format from get_order_records",
+            result_type=type(result),
+            result=result,
+        )
+        return []
+
+    if isinstance(data, list) and len(data) > 0 and "orders" in data[0]:
+        data = data[0]["orders"]
+    return list(data) if isinstance(data, list) else []
+
+
+def _total_pages(result: Any) -> int:
+    """Page count reported by a get_order_records response"""
+    if hasattr(result, "total_page"):
+        return int(result.total_page)
+    if isinstance(result, dict) and "total_page" in result:
+        return int(result["total_page"])
+    return 1
+
+
+def _filter_orders(orders: list[dict], symbol: str | None) -> list[dict]:
+    """Orders for one symbol, or a copy of all of them"""
+    if not symbol:
+        return list(orders)
+    return [
+        order
+        for order in orders
+        if (
+            order.get("symbol")
+            if isinstance(order, dict)
+            else getattr(order, "symbol", None)
+        )
+        == symbol
+    ]
+
 
 class DeltaDeFiClient:
     """DeltaDeFi client wrapper with rate limiting and error handling"""
@@ -53,6 +108,27 @@ class DeltaDeFiClient:
             api_key=self.api_key,
         )
 
+        # Open orders as last fetched with their time.monotonic() stamp, keyed
+        # by the symbol the exchange filtered on (None: all symbols, which
+        # serves any symbol) until they expire or orders change
+        self.open_orders_ttl = settings.system.open_orders_ttl_seconds
+        self._open_orders_cache: dict[str | None, tuple[float, list[dict]]] = {}
+        # Bumped on every invalidation, so a fetch that overlapped an order
+        # change is not cached
+        self._open_orders_version = 0
+        # Whether get_order_records takes a symbol; None until first tried
+        self._supports_symbol_filter: bool | None = None
+
+        # Orders waiting to go out in the next batch request, with the future
+        # their submit_order call awaits; drained by _submit_worker, which
+        # exits when the queue runs dry and is restarted by the next submit
+        self.order_batch_window = settings.system.order_batch_window_ms / 1000
+        self.order_batch_max_size = settings.system.order_batch_max_size
+        self._submit_queue: asyncio.Queue[
+            tuple[dict[str, Any], asyncio.Future[dict[str, Any]]]
+        ] = asyncio.Queue()
+        self._submit_task: asyncio.Task[None] | None = None
+
         # Load operation key if trading password is provided
         self._operation_key_loaded = False
         if self.trading_password:
@@ -84,7 +160,7 @@ class DeltaDeFiClient:
         logger.debug("Getting account balance")
 
         try:
-            balance = self._client.accounts.get_account_balance()
+            balance = await asyncio.to_thread(self._client.accounts.get_account_balance)
             logger.info("Account balance retrieved", balance=balance)
             return balance
         except Exception as e:
@@ -103,7 +179,9 @@ class DeltaDeFiClient:
         logger.debug("Getting market price", symbol=symbol)
 
         try:
-            price = self._client.markets.get_market_price(symbol)
+            price = await asyncio.to_thread(
+                self._client.markets.get_market_price, symbol
+            )
             logger.debug("Market price retrieved", symbol=symbol, price=price)
             return price
         except Exception as e:
@@ -128,8 +206,6 @@ class DeltaDeFiClient:
         Returns:
             Aggregated price data
         """
-        import time
-
         if start is None:
             start = int(time.time() - 86400)  # 24 hours ago
         if end is None:
@@ -138,8 +214,12 @@ class DeltaDeFiClient:
         logger.debug("Getting aggregated price", symbol=symbol, interval=interval)
 
         try:
-            price_data = self._client.markets.get_aggregated_price(
-                symbol=symbol, interval=interval, start=start, end=end
+            price_data = await asyncio.to_thread(
+                self._client.markets.get_aggregated_price,
+                symbol=symbol,
+                interval=interval,
+                start=start,
+                end=end,
             )
             logger.debug("Aggregated price retrieved", symbol=symbol)
             return price_data
@@ -175,8 +255,6 @@ class DeltaDeFiClient:
         if not self._operation_key_loaded:
             raise ValueError("Operation key not loaded - cannot submit orders")
 
-        await self.rate_limiter.wait_for_token()
-
         # Round price to 4 decimal places as required by DeltaDeFi
         formatted_price = round(price, 4) if price is not None else None
 
@@ -191,17 +269,30 @@ class DeltaDeFiClient:
             kwargs=kwargs,
         )
 
-        try:
-            # Use the SDK's post_order method which handles build/sign/submit
-            result = self._client.post_order(
-                symbol=symbol,
-                side=side,  # SDK expects string, will handle conversion internally
-                type=order_type,  # SDK expects string, will handle conversion internally
-                quantity=quantity,
-                price=formatted_price,
-                **kwargs,
-            )
+        order = {
+            "symbol": symbol,
+            "side": side,  # SDK expects string, will handle conversion internally
+            "type": order_type,  # SDK expects string, will handle conversion internally
+            "quantity": quantity,
+            "price": formatted_price,
+            **kwargs,
+        }
 
+        try:
+            if self._batch_post_orders() is not None:
+                future: asyncio.Future[dict[str, Any]] = (
+                    asyncio.get_running_loop().create_future()
+                )
+                self._submit_queue.put_nowait((order, future))
+                if self._submit_task is None or self._submit_task.done():
+                    self._submit_task = asyncio.create_task(self._submit_worker())
+                result = await future
+            else:
+                await self.rate_limiter.wait_for_token()
+                # Use the SDK's post_order method which handles build/sign/submit
+                result = await asyncio.to_thread(self._client.post_order, **order)
+
+            self.invalidate_open_orders()
             logger.info(
                 "Order submitted successfully",
                 result=result,
@@ -223,6 +314,62 @@ class DeltaDeFiClient:
             )
             raise
 
+    async def _wait_for_tokens(self, count: int) -> None:
+        """Take count rate-limit tokens in chunks the bucket can hold"""
+        step = self.rate_limiter.max_tokens
+        for taken in range(0, count, step):
+            await self.rate_limiter.wait_for_token(min(step, count - taken))
+
+    def _batch_post_orders(self) -> Callable[..., Any] | None:
+        """The SDK batch order endpoint, if it has one and batching is enabled"""
+        if self.order_batch_window <= 0 or self.order_batch_max_size <= 1:
+            return None
+        return getattr(self._client, "post_orders_batch", None)
+
+    async def _submit_worker(self) -> None:
+        """Send queued orders in batches until the queue is empty"""
+        loop = asyncio.get_running_loop()
+
+        while not self._submit_queue.empty():
+            # Wait out the coalescing window from the first order so a burst
+            # of submits shares one request
+            batch = [self._submit_queue.get_nowait()]
+            deadline = loop.time() + self.order_batch_window
+            while len(batch) < self.order_batch_max_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(
+                        await asyncio.wait_for(self._submit_queue.get(), timeout)
+                    )
+                except TimeoutError:
+                    break
+
+            orders = [order for order, _ in batch]
+            futures = [future for _, future in batch]
+            try:
+                # One token per order, so max_orders_per_second still caps orders
+                await self._wait_for_tokens(len(orders))
+                result = await asyncio.to_thread(
+                    self._client.post_orders_batch, orders=orders
+                )
+                results = result if isinstance(result, list) else None
+                if results is None or len(results) != len(orders):
+                    raise ValueError(
+                        f"Batch order response does not match {len(orders)} orders"
+                    )
+            except Exception as e:
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            logger.debug("Order batch submitted", count=len(orders))
+            for future, order_result in zip(futures, results, strict=True):
+                if not future.done():
+                    future.set_result(order_result)
+
     async def cancel_order(
         self, order_id: str, symbol: str | None = None, **kwargs
     ) -> dict:
@@ -247,8 +394,11 @@ class DeltaDeFiClient:
         logger.info("Cancelling order", order_id=order_id, symbol=symbol)
 
         try:
-            result = self._client.cancel_order(order_id=order_id, **kwargs)
+            result = await asyncio.to_thread(
+                self._client.cancel_order, order_id=order_id, **kwargs
+            )
 
+            self.invalidate_open_orders()
             logger.info(
                 "Order cancelled successfully",
                 result=result,
@@ -267,96 +417,153 @@ class DeltaDeFiClient:
             )
             raise
 
-    async def get_open_orders(self, symbol: str | None = None) -> list[dict]:
-        """Get open orders from DeltaDeFi
+    async def cancel_orders(self, order_ids: list[str]) -> list[dict]:
+        """Cancel several orders at once
+
+        Uses the SDK batch-cancel endpoint when it exists (one request, one
+        rate-limit token); otherwise the individual cancels run concurrently.
 
         Args:
-            symbol: Optional symbol to filter orders (e.g., "ADAUSDM")
+            order_ids: Order IDs to cancel
 
         Returns:
-            List of open orders
+            Cancel results
 
         Raises:
             ValueError: If operation key is not loaded
         """
         if not self._operation_key_loaded:
-            raise ValueError("Operation key not loaded - cannot get orders")
+            raise ValueError("Operation key not loaded - cannot cancel orders")
+        if not order_ids:
+            return []
 
-        logger.debug("Getting open orders", symbol=symbol)
+        batch_cancel = getattr(self._client, "cancel_orders", None) or getattr(
+            self._client, "post_cancel_batch", None
+        )
+
+        logger.info(
+            "Cancelling orders",
+            count=len(order_ids),
+            batched=batch_cancel is not None,
+        )
 
         try:
-            # Use pagination to fetch ALL open orders (up to 250 per request)
-            all_orders = []
-            page = 1
-
-            while True:
-                # Get orders for current page with maximum limit
-                result = self._client.accounts.get_order_records(
-                    status="openOrder",
-                    limit=250,  # Maximum per request
-                    page=page,
+            if batch_cancel is not None:
+                await self.rate_limiter.wait_for_token()
+                result = await asyncio.to_thread(batch_cancel, order_ids=order_ids)
+                results = result if isinstance(result, list) else [result]
+            else:
+                await self._wait_for_tokens(len(order_ids))
+                results = list(
+                    await asyncio.gather(
+                        *[
+                            asyncio.to_thread(
+                                self._client.cancel_order, order_id=order_id
+                            )
+                            for order_id in order_ids
+                        ]
+                    )
                 )
 
-                # Extract orders from the response - handle nested structure
-                page_orders = []
-                if hasattr(result, "data") and result.data:
-                    # SDK response object with data attribute
-                    data = result.data
-                    if isinstance(data, list) and len(data) > 0 and "orders" in data[0]:
-                        page_orders = data[0]["orders"]
-                    else:
-                        page_orders = data if isinstance(data, list) else []
-                elif isinstance(result, dict) and "data" in result:
-                    # Dict response with nested structure
-                    data = result["data"]
-                    if isinstance(data, list) and len(data) > 0 and "orders" in data[0]:
-                        page_orders = data[0]["orders"]
-                    else:
-                        page_orders = data if isinstance(data, list) else []
-                elif isinstance(result, list):
-                    # Direct list of orders
-                    page_orders = result
-                else:
-                    logger.warning(
-                        "Unexpected response format from get_order_records",
-                        result_type=type(result),
-                        result=result,
-                    )
-                    page_orders = []
+            self.invalidate_open_orders()
+            logger.info("Orders cancelled successfully", count=len(order_ids))
 
-                if not page_orders:
-                    # No more orders on this page, we're done
-                    break
+            return results
 
-                all_orders.extend(page_orders)
+        except Exception as e:
+            # Some cancels may have landed before the failure
+            self.invalidate_open_orders()
+            logger.error(
+                "Failed to cancel orders",
+                order_ids=order_ids,
+                error=str(e),
+            )
+            raise
 
-                # Check if we have more pages
-                total_pages = 1
-                if hasattr(result, "total_page"):
-                    total_pages = result.total_page
-                elif isinstance(result, dict) and "total_page" in result:
-                    total_pages = result["total_page"]
+    def invalidate_open_orders(self) -> None:
+        """Drop cached open orders so the next get_open_orders refetches"""
+        self._open_orders_cache.clear()
+        self._open_orders_version += 1
 
-                if page >= total_pages:
-                    # We've fetched all pages
-                    break
+    def on_account_update(self, data: dict) -> None:
+        """Account stream callback: order changes invalidate cached orders"""
+        if data.get("sub_type") in _ORDER_CHANGE_SUB_TYPES:
+            self.invalidate_open_orders()
 
-                page += 1
+    async def _fetch_open_orders_page(self, page: int, symbol: str | None) -> Any:
+        """Fetch one page of open orders in a worker thread
 
-            orders = all_orders
+        The symbol is passed to the exchange when the SDK accepts it; whether
+        it does is found out on the first filtered call and remembered.
+        """
+        kwargs: dict[str, Any] = {"status": "openOrder", "limit": 250, "page": page}
+        if symbol and self._supports_symbol_filter is not False:
+            try:
+                result = await asyncio.to_thread(
+                    self._client.accounts.get_order_records, symbol=symbol, **kwargs
+                )
+            except TypeError as e:
+                if "symbol" not in str(e):
+                    raise
+                self._supports_symbol_filter = False
+                logger.info("SDK has no symbol filter for order records")
+            else:
+                self._supports_symbol_filter = True
+                return result
+
+        return await asyncio.to_thread(
+            self._client.accounts.get_order_records, **kwargs
+        )
 
-            # Filter by symbol if provided
-            if symbol:
-                filtered_orders = []
-                for order in orders:
-                    order_symbol = (
-                        order.get("symbol")
-                        if isinstance(order, dict)
-                        else getattr(order, "symbol", None)
+    async def get_open_orders(self, symbol: str | None = None) -> list[dict]:
+        """Get open orders from DeltaDeFi
+
+        Args:
+            symbol: Optional symbol to filter orders (e.g., "ADAUSDM")
+
+        Returns:
+            List of open orders
+
+        Raises:
+            ValueError: If operation key is not loaded
+        """
+        if not self._operation_key_loaded:
+            raise ValueError("Operation key not loaded - cannot get orders")
+
+        logger.debug("Getting open orders", symbol=symbol)
+
+        now = time.monotonic()
+        for key in (symbol, None) if symbol else (None,):
+            cached = self._open_orders_cache.get(key)
+            if cached is not None and now - cached[0] < self.open_orders_ttl:
+                return _filter_orders(cached[1], symbol)
+
+        try:
+            fetched_at = time.monotonic()
+            version = self._open_orders_version
+            # Use pagination to fetch ALL open orders (up to 250 per request).
+            # Page 1 says how many pages there are; the rest are fetched
+            # concurrently, each off the event loop.
+            first = await self._fetch_open_orders_page(1, symbol)
+            page_orders = _extract_orders(first)
+            all_orders = list(page_orders)
+
+            total_pages = _total_pages(first) if page_orders else 1
+            if total_pages > 1:
+                results = await asyncio.gather(
+                    *(
+                        self._fetch_open_orders_page(page, symbol)
+                        for page in range(2, total_pages + 1)
                     )
-                    if order_symbol == symbol:
-                        filtered_orders.append(order)
-                orders = filtered_orders
+                )
+                for result in results:
+                    all_orders.extend(_extract_orders(result))
+
+            if version == self._open_orders_version:
+                key = symbol if symbol and self._supports_symbol_filter else None
+                self._open_orders_cache[key] = (fetched_at, all_orders)
+            # Still filtered locally, in case the exchange ignores the symbol
+            orders = _filter_orders(all_orders, symbol)
 
             logger.info(
                 "Open orders retrieved successfully",
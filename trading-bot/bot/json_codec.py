@@ -0,0 +1,41 @@
+"""
+JSON encoding shared by the bot's modules
+
+orjson is optional (the "speedups" extra): it is used when installed, and the
+stdlib json module otherwise. Both decode str or bytes, but the encoded output
+differs between them:
+
+- stdlib json writes ", " and ": " separators; orjson output is compact
+- orjson raises on non-str dict keys and on integers wider than 64 bits,
+  which stdlib json accepts
+
+Callers must not depend on the exact text, and should only encode str-keyed
+data with 64-bit integers.
+"""
+
+from collections.abc import Callable
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+HAS_ORJSON = orjson is not None
+
+loads: Callable[[bytes | str], Any] = orjson.loads if HAS_ORJSON else json.loads
+
+
+def dumps(obj: Any, default: Callable[[Any], Any] | None = None) -> bytes:
+    """Serialize to UTF-8 encoded JSON"""
+    if HAS_ORJSON:
+        return orjson.dumps(obj, default=default)
+    return json.dumps(obj, default=default).encode()
+
+
+def dumps_str(obj: Any, default: Callable[[Any], Any] | None = None) -> str:
+    """Serialize to JSON text"""
+    if HAS_ORJSON:
+        return orjson.dumps(obj, default=default).decode()
+    return json.dumps(obj, default=default)
@@ -7,6 +7,13 @@ import sys
 
 import structlog
 
+from bot import json_codec
+
+
+def _json_renderer() -> structlog.processors.JSONRenderer:
+    """JSON renderer backed by orjson when it is installed"""
+    return structlog.processors.JSONRenderer(serializer=json_codec.dumps_str)
+
 
 def setup_logging():
     """Configure structured logging"""
@@ -26,7 +33,7 @@ def setup_logging():
             structlog.processors.StackInfoRenderer(),
             structlog.processors.format_exc_info,
             structlog.processors.UnicodeDecoder(),
-            structlog.processors.JSONRenderer(),
+            _json_renderer(),
         ],
         context_class=dict,
         logger_factory=structlog.stdlib.LoggerFactory(),
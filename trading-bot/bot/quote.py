@@ -175,6 +175,7 @@ class QuoteEngine:
         if not settings.is_side_enabled("bid"):
             return None
 
+        trading = settings.trading
         bid_layers = []
         bid_reference_price = book_ticker.bid_price
 
@@ -183,37 +184,39 @@ class QuoteEngine:
         bid_alloc, ask_alloc = self.asset_ratio_manager.get_capital_allocation()
 
         # Calculate base layer notional with capital allocation
-        total_available_liquidity = settings.trading.total_liquidity * bid_alloc
-        base_layer_notional = total_available_liquidity / settings.trading.num_layers
-
-        for layer_i in range(1, settings.trading.num_layers + 1):
+        total_available_liquidity = trading.total_liquidity * bid_alloc
+        base_layer_notional = total_available_liquidity / trading.num_layers
+
+        # Read loop-invariant config and adjustments once, outside the layer loop
+        first_spread_bps = trading.base_spread_bps
+        tick_spread_bps = trading.tick_spread_bps
+        liquidity_growth = trading.layer_liquidity_multiplier
+        min_quote_size = trading.min_quote_size
+        spread_multiplier = ratio_adjustment.bid_spread_multiplier
+        liquidity_multiplier = ratio_adjustment.bid_liquidity_multiplier
+        precision = self._precision
+
+        for layer_i in range(1, trading.num_layers + 1):
             # Calculate base spread for this layer
-            base_spread_bps = (
-                settings.trading.base_spread_bps
-                + (layer_i - 1) * settings.trading.tick_spread_bps
-            )
+            base_spread_bps = first_spread_bps + (layer_i - 1) * tick_spread_bps
 
             # Apply ratio-based spread adjustment
-            adjusted_spread_bps = (
-                base_spread_bps * ratio_adjustment.bid_spread_multiplier
-            )
+            adjusted_spread_bps = base_spread_bps * spread_multiplier
 
             # Calculate price according to spec: bid_reference_price * (1 - spread_bps/10000)
             layer_price = bid_reference_price * (1 - adjusted_spread_bps / 10000)
 
             # Calculate quantity with progressive growth and ratio adjustment
-            growth_factor = (
-                1 + (layer_i - 1) * settings.trading.layer_liquidity_multiplier
-            )
+            growth_factor = 1 + (layer_i - 1) * liquidity_growth
             base_quantity = (base_layer_notional * growth_factor) / layer_price
-            layer_quantity = base_quantity * ratio_adjustment.bid_liquidity_multiplier
+            layer_quantity = base_quantity * liquidity_multiplier
 
             # Apply minimum size constraint
-            if layer_quantity < settings.trading.min_quote_size:
-                layer_quantity = settings.trading.min_quote_size
+            if layer_quantity < min_quote_size:
+                layer_quantity = min_quote_size
 
             # Round to appropriate precision
-            layer_price = round(layer_price, self._precision)
+            layer_price = round(layer_price, precision)
             layer_quantity = round(layer_quantity, 2)
 
             bid_layers.append(
@@ -234,6 +237,7 @@ class QuoteEngine:
         if not settings.is_side_enabled("ask"):
             return None
 
+        trading = settings.trading
         ask_layers = []
         ask_reference_price = book_ticker.ask_price
 
@@ -242,37 +246,39 @@ class QuoteEngine:
         bid_alloc, ask_alloc = self.asset_ratio_manager.get_capital_allocation()
 
         # Calculate base layer notional with capital allocation
-        total_available_liquidity = settings.trading.total_liquidity * ask_alloc
-        base_layer_notional = total_available_liquidity / settings.trading.num_layers
-
-        for layer_i in range(1, settings.trading.num_layers + 1):
+        total_available_liquidity = trading.total_liquidity * ask_alloc
+        base_layer_notional = total_available_liquidity / trading.num_layers
+
+        # Read loop-invariant config and adjustments once, outside the layer loop
+        first_spread_bps = trading.base_spread_bps
+        tick_spread_bps = trading.tick_spread_bps
+        liquidity_growth = trading.layer_liquidity_multiplier
+        min_quote_size = trading.min_quote_size
+        spread_multiplier = ratio_adjustment.ask_spread_multiplier
+        liquidity_multiplier = ratio_adjustment.ask_liquidity_multiplier
+        precision = self._precision
+
+        for layer_i in range(1, trading.num_layers + 1):
             # Calculate base spread for this layer
-            base_spread_bps = (
-                settings.trading.base_spread_bps
-                + (layer_i - 1) * settings.trading.tick_spread_bps
-            )
+            base_spread_bps = first_spread_bps + (layer_i - 1) * tick_spread_bps
 
             # Apply ratio-based spread adjustment
-            adjusted_spread_bps = (
-                base_spread_bps * ratio_adjustment.ask_spread_multiplier
-            )
+            adjusted_spread_bps = base_spread_bps * spread_multiplier
 
             # Calculate price according to spec: ask_reference_price * (1 + spread_bps/10000)
             layer_price = ask_reference_price * (1 + adjusted_spread_bps / 10000)
 
             # Calculate quantity with progressive growth and ratio adjustment
-            growth_factor = (
-                1 + (layer_i - 1) * settings.trading.layer_liquidity_multiplier
-            )
+            growth_factor = 1 + (layer_i - 1) * liquidity_growth
             base_quantity = (base_layer_notional * growth_factor) / layer_price
-            layer_quantity = base_quantity * ratio_adjustment.ask_liquidity_multiplier
+            layer_quantity = base_quantity * liquidity_multiplier
 
             # Apply minimum size constraint
-            if layer_quantity < settings.trading.min_quote_size:
-                layer_quantity = settings.trading.min_quote_size
+            if layer_quantity < min_quote_size:
+                layer_quantity = min_quote_size
 
             # Round to appropriate precision
-            layer_price = round(layer_price, self._precision)
+            layer_price = round(layer_price, precision)
             layer_quantity = round(layer_quantity, 2)
 
             ask_layers.append(
@@ -13,7 +13,6 @@ from collections.abc import Callable
 from dataclasses import dataclass, field
 from decimal import Decimal
 from enum import Enum
-import json
 import time
 from typing import Any
 import uuid
@@ -21,7 +20,7 @@ import uuid
 import structlog
 
 from bot.config import settings
-from bot.db.repo import outbox_repo
+from bot.db.repo import decode_sides, encode_sides, outbox_repo
 from bot.db.sqlite import db_manager
 from bot.deltadefi import DeltaDeFiClient
 from bot.oms import OMSOrder, OrderManagementSystem, OrderSide, OrderState
@@ -178,41 +177,39 @@ class QuoteRepository:
         ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
         """
 
-        async with db_manager.get_connection() as conn:
-            cursor = await conn.execute(
-                query,
-                (
-                    quote.quote_id,
-                    quote.timestamp,
-                    quote.symbol_src,
-                    quote.symbol_dst,
-                    float(quote.source_bid_price),
-                    float(quote.source_bid_qty),
-                    float(quote.source_ask_price),
-                    float(quote.source_ask_qty),
-                    float(quote.bid_price) if quote.bid_price else None,
-                    float(quote.bid_qty) if quote.bid_qty else None,
-                    float(quote.ask_price) if quote.ask_price else None,
-                    float(quote.ask_qty) if quote.ask_qty else None,
-                    float(quote.spread_bps) if quote.spread_bps else None,
-                    float(quote.mid_price) if quote.mid_price else None,
-                    quote.total_spread_bps,
-                    json.dumps(quote.sides_enabled),
-                    quote.strategy,
-                    quote.status,
-                    quote.created_at,
-                    quote.updated_at,
-                    quote.expires_at,
-                    quote.bid_order_id,
-                    quote.ask_order_id,
-                ),
-            )
-
-            quote_id = cursor.lastrowid
-            await conn.commit()
+        # Through the shared writer, so quotes from concurrent ticks share a
+        # commit instead of paying for one each
+        quote_id = await db_manager.execute(
+            query,
+            (
+                quote.quote_id,
+                quote.timestamp,
+                quote.symbol_src,
+                quote.symbol_dst,
+                float(quote.source_bid_price),
+                float(quote.source_bid_qty),
+                float(quote.source_ask_price),
+                float(quote.source_ask_qty),
+                float(quote.bid_price) if quote.bid_price else None,
+                float(quote.bid_qty) if quote.bid_qty else None,
+                float(quote.ask_price) if quote.ask_price else None,
+                float(quote.ask_qty) if quote.ask_qty else None,
+                float(quote.spread_bps) if quote.spread_bps else None,
+                float(quote.mid_price) if quote.mid_price else None,
+                quote.total_spread_bps,
+                encode_sides(quote.sides_enabled),
+                quote.strategy,
+                quote.status,
+                quote.created_at,
+                quote.updated_at,
+                quote.expires_at,
+                quote.bid_order_id,
+                quote.ask_order_id,
+            ),
+        )
 
-            quote.id = quote_id
-            return quote_id
+        quote.id = quote_id
+        return quote_id
 
     async def update_quote_status(
         self, quote_id: str, status: QuoteStatus, **kwargs
@@ -299,7 +296,7 @@ class QuoteRepository:
             spread_bps=Decimal(str(row["spread_bps"])) if row["spread_bps"] else None,
             mid_price=Decimal(str(row["mid_price"])) if row["mid_price"] else None,
             total_spread_bps=row["total_spread_bps"],
-            sides_enabled=json.loads(row["sides_enabled"]),
+            sides_enabled=decode_sides(row["sides_enabled"]),
             strategy=QuoteStrategy(row["strategy"]),
             status=QuoteStatus(row["status"]),
             created_at=row["created_at"],
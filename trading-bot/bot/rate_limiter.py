@@ -64,17 +64,26 @@ class TokenBucketRateLimiter:
         """
         Wait until enough tokens are available
 
+        The lock is only held to check and take tokens; the sleep happens
+        outside it, so concurrent waiters are paced by the refill rate alone.
+
         Args:
             tokens: Number of tokens needed
         """
-        while not await self.acquire(tokens):
-            wait_time = self._time_until_available(tokens)
-            logger.info(
+        while True:
+            async with self._lock:
+                self._refill()
+                if self.tokens >= tokens:
+                    self.tokens -= tokens
+                    return
+                wait_time = self._time_until_available(tokens)
+
+            logger.debug(
                 "Waiting for rate limit tokens",
                 wait_time=wait_time,
                 tokens_needed=tokens,
             )
-            await asyncio.sleep(min(wait_time, 0.1))  # Check every 100ms max
+            await asyncio.sleep(wait_time)
 
     def _refill(self) -> None:
         """Refill tokens based on elapsed time"""
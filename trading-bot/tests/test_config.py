@@ -2,10 +2,21 @@
 Tests for configuration management
 """
 
+import json
 import os
+import sys
+import types
 from unittest.mock import patch
 
-from bot.config import ExchangeConfig, RiskConfig, Settings, SystemConfig, TradingConfig
+from bot.config import (
+    ExchangeConfig,
+    RiskConfig,
+    Settings,
+    SystemConfig,
+    TradingConfig,
+    _load_yaml,
+)
+from bot.config_compile import render_defaults
 
 
 class TestTradingConfig:
@@ -101,6 +112,118 @@ class TestSettings:
         assert settings.trading.anchor_bps == 10
         assert settings.trading.qty == 200.5
 
+    def test_from_yaml_uses_json_cache(self, tmp_path):
+        """Test that parsed YAML is cached and reused while fresh"""
+        yaml_path = tmp_path / "config.yaml"
+        yaml_path.write_text("trading:\n  anchor_bps: 7\n")
+
+        settings = Settings.from_yaml(yaml_path)
+        cache_path = tmp_path / "config.yaml.json"
+
+        assert settings.trading.anchor_bps == 7
+        assert json.loads(cache_path.read_text()) == {"trading": {"anchor_bps": 7}}
+
+        # A fresh cache is read instead of the YAML file
+        cache_path.write_text('{"trading": {"anchor_bps": 9}}')
+        assert Settings.from_yaml(yaml_path).trading.anchor_bps == 9
+
+        # Editing the YAML file invalidates the cache
+        yaml_path.write_text("trading:\n  anchor_bps: 11\n")
+        os.utime(cache_path, (0, 0))
+        assert Settings.from_yaml(yaml_path).trading.anchor_bps == 11
+
+    def test_from_yaml_memoizes_parse(self, tmp_path):
+        """Test that unchanged config files are not re-read in-process"""
+        yaml_path = tmp_path / "config.yaml"
+        yaml_path.write_text("trading:\n  anchor_bps: 7\n")
+        Settings.from_yaml(yaml_path)  # Writes the JSON sidecar
+        Settings.from_yaml(yaml_path)
+
+        hits = _load_yaml.cache_info().hits
+        assert Settings.from_yaml(yaml_path).trading.anchor_bps == 7
+        assert _load_yaml.cache_info().hits == hits + 1
+
+    def test_from_yaml_uses_compiled_defaults(self, tmp_path, monkeypatch):
+        """Test that a generated defaults module replaces YAML parsing"""
+        yaml_path = tmp_path / "config.yaml"
+        yaml_path.write_bytes(b"trading:\n  anchor_bps: 6\n")
+
+        module = types.ModuleType("bot.config_defaults")
+        exec(render_defaults(yaml_path.read_bytes()), module.__dict__)
+        module.DEFAULTS["trading"]["anchor_bps"] = 12  # Prove the module is used
+        monkeypatch.setitem(sys.modules, "bot.config_defaults", module)
+
+        assert Settings.from_yaml(yaml_path).trading.anchor_bps == 12
+
+        # A stale module (hash mismatch) is ignored
+        yaml_path.write_bytes(b"trading:\n  anchor_bps: 3\n")
+        os.utime(yaml_path, ns=(1, 1))  # Distinct mtime for the in-process memo
+        assert Settings.from_yaml(yaml_path).trading.anchor_bps == 3
+
+    def test_env_file_parsing(self, tmp_path, monkeypatch):
+        """Test the plain .env reader handles comments, quotes and export"""
+        (tmp_path / ".env").write_text(
+            "# secrets\n"
+            "EXCHANGE__DELTADEFI_API_KEY=file_key\n"
+            'export EXCHANGE__TRADING_PASSWORD="p#ss word" # prod pw\n'
+            "SYSTEM__MODE=mainnet   # testnet, mainnet\n"
+            "SYSTEM__LOG_LEVEL='DEBUG'\n"
+        )
+        monkeypatch.chdir(tmp_path)
+
+        settings = Settings()
+
+        assert settings.exchange.deltadefi_api_key == "file_key"
+        assert settings.exchange.trading_password == "p#ss word"
+        assert settings.system.mode == "mainnet"
+        assert settings.system.log_level == "DEBUG"
+
+    def test_env_file_override(self, tmp_path, monkeypatch):
+        """Test a construction-time _env_file replaces the default .env"""
+        (tmp_path / "other.env").write_text("EXCHANGE__DELTADEFI_API_KEY=fromfile\n")
+        monkeypatch.chdir(tmp_path)
+
+        settings = Settings(_env_file=tmp_path / "other.env")
+
+        assert settings.exchange.deltadefi_api_key == "fromfile"
+
+    @patch.dict(os.environ, {"EXCHANGE__DELTADEFI_API_KEY": "env_test_key"})
+    def test_from_dict_skips_settings_sources(self):
+        """Test building settings from a pre-parsed dict"""
+        settings = Settings.from_dict(
+            {"trading": {"anchor_bps": 4, "side_enable": ["ask"]}}
+        )
+
+        assert settings.trading.anchor_bps == 4
+        assert settings.total_spread_bps == 7
+        assert settings.is_side_enabled("bid") is False
+        assert settings.exchange.deltadefi_api_key == ""  # Env not consulted
+
+    def test_reload_reuses_unchanged_sections(self):
+        """Test reload only rebuilds sections whose data changed"""
+        data = {"trading": {"anchor_bps": 4}, "risk": {"max_open_orders": 5}}
+        settings = Settings.from_dict(data)
+
+        reloaded = settings.reload({**data, "risk": {"max_open_orders": 8}})
+
+        assert reloaded.trading is settings.trading
+        assert reloaded.system is settings.system
+        assert reloaded.risk is not settings.risk
+        assert reloaded.risk.max_open_orders == 8
+
+    @patch.dict(os.environ, {"EXCHANGE__DELTADEFI_API_KEY": "env_secret"})
+    def test_reload_keeps_env_values(self):
+        """Test reload keeps env-provided fields the config dict does not set"""
+        settings = Settings(trading={"anchor_bps": 4})
+
+        reloaded = settings.reload({"trading": {"anchor_bps": 6}})
+        assert reloaded.exchange is settings.exchange
+        assert reloaded.exchange.deltadefi_api_key == "env_secret"
+
+        reloaded = settings.reload({"exchange": {"trading_password": "pw"}})
+        assert reloaded.exchange.deltadefi_api_key == "env_secret"
+        assert reloaded.exchange.trading_password == "pw"
+
     def test_nested_config_structure(self):
         """Test nested configuration structure"""
         settings = Settings(exchange__deltadefi_api_key="test_key")
@@ -110,6 +233,21 @@ class TestSettings:
         assert isinstance(settings.risk, RiskConfig)
         assert isinstance(settings.system, SystemConfig)
 
+    def test_schemas_built_at_import(self):
+        """Test validators are compiled once at import, not per instance"""
+        for model in (
+            Settings,
+            TradingConfig,
+            ExchangeConfig,
+            RiskConfig,
+            SystemConfig,
+        ):
+            assert model.__pydantic_complete__
+
+        validator = TradingConfig.__pydantic_validator__
+        TradingConfig(anchor_bps=1)
+        assert TradingConfig.__pydantic_validator__ is validator
+
 
 class TestRiskConfig:
     def test_default_risk_values(self):
@@ -131,3 +269,5 @@ class TestSystemConfig:
         assert config.log_level == "INFO"
         assert config.db_path == "trading_bot.db"
         assert config.max_orders_per_second == 5.0
+        assert config.order_batch_window_ms == 10.0
+        assert config.order_batch_max_size == 10
@@ -0,0 +1,178 @@
+"""
+Tests for the DeltaDeFi client wrapper, run against a stub SDK client
+"""
+
+import asyncio
+import importlib.util
+import sys
+import types
+
+import pytest
+
+
+class StubAccounts:
+    """Stands in for ApiClient.accounts"""
+
+    def __init__(self):
+        self.orders = [
+            {"order_id": "o1", "symbol": "ADAUSDM"},
+            {"order_id": "o2", "symbol": "BTCUSDM"},
+        ]
+        self.calls = []
+        self.on_fetch = None
+
+    def get_order_records(self, **kwargs):
+        self.calls.append(kwargs)
+        if self.on_fetch:
+            self.on_fetch()
+        return {"data": list(self.orders), "total_page": 1}
+
+
+class StubApiClient:
+    """Stands in for deltadefi.ApiClient"""
+
+    def __init__(self, **kwargs):
+        self.accounts = StubAccounts()
+
+    def load_operation_key(self, password):
+        pass
+
+    def post_order(self, **order):
+        return {"order_id": f"order_{order['price']}"}
+
+
+@pytest.fixture
+def deltadefi(monkeypatch):
+    """The bot.deltadefi module with the SDK client replaced by the stub"""
+    if importlib.util.find_spec("deltadefi") is None:
+        sdk = types.ModuleType("deltadefi")
+        sdk.ApiClient = StubApiClient
+        monkeypatch.setitem(sys.modules, "deltadefi", sdk)
+
+    import bot.deltadefi
+
+    monkeypatch.setattr(bot.deltadefi, "ApiClient", StubApiClient)
+    return bot.deltadefi
+
+
+@pytest.fixture
+def client(deltadefi):
+    """A client with its operation key loaded"""
+    return deltadefi.DeltaDeFiClient(api_key="key", trading_password="password")
+
+
+class TestOpenOrders:
+    @pytest.mark.asyncio
+    async def test_cached_until_ttl(self, client):
+        """Test open orders are fetched once per TTL and filtered by symbol"""
+        calls = client._client.accounts.calls
+
+        assert len(await client.get_open_orders()) == 2
+        orders = await client.get_open_orders("ADAUSDM")
+        assert [order["order_id"] for order in orders] == ["o1"]
+        assert len(calls) == 1
+
+        client.open_orders_ttl = 0
+        await client.get_open_orders()
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_order_changes_invalidate_cache(self, client):
+        """Test account stream order updates force a refetch"""
+        calls = client._client.accounts.calls
+        await client.get_open_orders()
+
+        client.on_account_update({"sub_type": "balance"})
+        await client.get_open_orders()
+        assert len(calls) == 1
+
+        client.on_account_update({"sub_type": "order_update"})
+        await client.get_open_orders()
+        assert len(calls) == 2
+
+        await client.submit_order("ADAUSDM", "buy", "limit", 10, 0.45)
+        await client.get_open_orders()
+        assert len(calls) == 3
+
+    @pytest.mark.asyncio
+    async def test_fetch_overlapping_change_not_cached(self, client):
+        """Test a fetch that raced an order change is not reused"""
+        accounts = client._client.accounts
+        accounts.on_fetch = client.invalidate_open_orders
+
+        await client.get_open_orders()
+        accounts.on_fetch = None
+        await client.get_open_orders()
+        await client.get_open_orders()
+
+        assert len(accounts.calls) == 2
+
+
+class BatchApiClient(StubApiClient):
+    """Stub SDK client with a batch order endpoint"""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.batches = []
+        self.drop_results = False
+
+    def post_orders_batch(self, orders):
+        self.batches.append(len(orders))
+        results = [{"order_id": f"order_{order['price']}"} for order in orders]
+        return results[1:] if self.drop_results else results
+
+
+class TestOrderBatching:
+    @pytest.fixture
+    def client(self, deltadefi, monkeypatch):
+        """A client on the batching SDK stub with plenty of rate-limit tokens"""
+        from bot.rate_limiter import TokenBucketRateLimiter
+
+        monkeypatch.setattr(deltadefi, "ApiClient", BatchApiClient)
+        return deltadefi.DeltaDeFiClient(
+            api_key="key",
+            trading_password="password",
+            rate_limiter=TokenBucketRateLimiter(max_tokens=50, refill_rate=0.001),
+        )
+
+    @staticmethod
+    async def submit(client, prices):
+        return await asyncio.gather(
+            *(client.submit_order("ADAUSDM", "buy", "limit", 10, p) for p in prices)
+        )
+
+    @pytest.mark.asyncio
+    async def test_burst_is_split_into_batches(self, client):
+        """Test a burst goes out in max-size batches, one result per caller"""
+        client.order_batch_max_size = 10
+
+        results = await self.submit(client, range(25))
+
+        assert client._client.batches == [10, 10, 5]
+        assert [r["order_id"] for r in results] == [f"order_{p}" for p in range(25)]
+        # Every order still costs a rate-limit token
+        assert 24 < client.rate_limiter.tokens < 26
+
+    @pytest.mark.asyncio
+    async def test_worker_restarts_after_idle(self, client):
+        """Test the worker exits when idle and the next submit restarts it"""
+        await self.submit(client, [1, 2])
+        assert client._submit_task.done()
+
+        result = await client.submit_order("ADAUSDM", "buy", "limit", 10, 3)
+
+        assert result == {"order_id": "order_3"}
+        assert client._client.batches == [2, 1]
+
+    @pytest.mark.asyncio
+    async def test_mismatched_response_fails_every_caller(self, client):
+        """Test a response that does not line up with the batch fails all of it"""
+        client._client.drop_results = True
+
+        results = await asyncio.gather(
+            *(client.submit_order("ADAUSDM", "buy", "limit", 10, p) for p in (1, 2)),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(r, ValueError) for r in results)
+        assert client._client.batches == [2]
@@ -0,0 +1,39 @@
+"""
+Tests for rate limiting utilities
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from bot.rate_limiter import TokenBucketRateLimiter
+
+
+class TestTokenBucketRateLimiter:
+    @pytest.mark.asyncio
+    async def test_acquire_until_empty(self):
+        """Test tokens are handed out until the bucket is empty"""
+        limiter = TokenBucketRateLimiter(max_tokens=2, refill_rate=0.001)
+
+        assert await limiter.acquire() is True
+        assert await limiter.acquire() is True
+        assert await limiter.acquire() is False
+
+    @pytest.mark.asyncio
+    async def test_concurrent_waiters_paced_by_rate(self):
+        """Test waiters sleep outside the lock, so calls overlap"""
+        limiter = TokenBucketRateLimiter(max_tokens=5, refill_rate=50.0)
+        round_trip = 0.2
+
+        async def submit():
+            await limiter.wait_for_token()
+            await asyncio.sleep(round_trip)  # The request itself
+
+        start = time.monotonic()
+        await asyncio.gather(*(submit() for _ in range(20)))
+        elapsed = time.monotonic() - start
+
+        # 15 tokens beyond the initial 5 take 0.3 s to refill; serialized
+        # requests would take 20 round trips
+        assert 0.3 <= elapsed < 1.0
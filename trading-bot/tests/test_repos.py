@@ -10,6 +10,7 @@ Tests the complete database layer including:
 
 import asyncio
 import json
+import sqlite3
 import time
 import uuid
 
@@ -25,7 +26,8 @@ from bot.db import (
     quote_repo,
     session_repo,
 )
-from bot.db.outbox_worker import OutboxWorker
+from bot.db.outbox_worker import OutboxEventHandler, OutboxMonitor, OutboxWorker
+from bot.db.repo import OutboxRepository, decode_sides, encode_sides
 from bot.db.sqlite import SQLiteManager
 
 
@@ -39,6 +41,18 @@ async def test_db():
     await test_manager.close()
 
 
+@pytest.fixture
+async def file_db(tmp_path, monkeypatch):
+    """Create a file-backed test database and point the repositories at it"""
+    import bot.db.repo
+
+    test_manager = SQLiteManager(str(tmp_path / "test.db"))
+    await test_manager.initialize()
+    monkeypatch.setattr(bot.db.repo, "db_manager", test_manager)
+    yield test_manager
+    await test_manager.close()
+
+
 @pytest.fixture
 def sample_quote_data():
     """Sample quote data for testing"""
@@ -114,6 +128,14 @@ class TestSQLiteManager:
         for table in expected_tables:
             assert table in tables
 
+    @pytest.mark.asyncio
+    async def test_get_table_info(self, file_db):
+        """Test table info is looked up by name and cached"""
+        columns = await file_db.get_table_info("quotes")
+        assert "quote_id" in [column["name"] for column in columns]
+        assert await file_db.get_table_info("quotes") is columns
+        assert await file_db.get_table_info("missing") == []
+
     @pytest.mark.asyncio
     async def test_connection_pooling(self, test_db):
         """Test connection pooling behavior"""
@@ -158,10 +180,239 @@ class TestSQLiteManager:
         assert stats["total_pages"] >= 0
         assert stats["page_size_bytes"] > 0
 
+    @pytest.mark.asyncio
+    async def test_concurrent_writes_group_commit(self, file_db):
+        """Test queued writes commit together and fail only individually"""
+        query = "INSERT INTO outbox (event_id, event_type, aggregate_id, payload) VALUES (?, 'order_created', 'order_1', '{}')"
+
+        results = await asyncio.gather(
+            *(file_db.execute(query, (f"event_{i}",)) for i in range(50)),
+            file_db.execute(query, ("event_0",)),  # Duplicate event_id
+            return_exceptions=True,
+        )
+
+        errors = [result for result in results if isinstance(result, Exception)]
+        assert len(errors) == 1
+        assert "UNIQUE" in str(errors[0])
+        assert len(set(results[:50])) == 50  # Each caller gets its own rowid
+        rows = await file_db.fetch_all("SELECT event_id FROM outbox")
+        assert len(rows) == 50
+
+    @pytest.mark.asyncio
+    async def test_failed_execute_many_is_undone(self, file_db):
+        """Test a failing executemany writes none of its rows, alone or grouped"""
+        await file_db.execute("CREATE TABLE t (x INTEGER PRIMARY KEY)")
+        query = "INSERT INTO t VALUES (?)"
+
+        with pytest.raises(sqlite3.IntegrityError):
+            await file_db.execute_many(query, [(1,), (2,), (2,), (3,)])
+        assert await file_db.fetch_all("SELECT x FROM t") == []
+
+        results = await asyncio.gather(
+            file_db.execute(query, (10,)),
+            file_db.execute_many(query, [(11,), (11,)]),
+            file_db.execute(query, (12,)),
+            return_exceptions=True,
+        )
+        assert isinstance(results[1], sqlite3.IntegrityError)
+        rows = await file_db.fetch_all("SELECT x FROM t ORDER BY x")
+        assert [row["x"] for row in rows] == [10, 12]
+
+    @pytest.mark.asyncio
+    async def test_writer_failure_fails_queued_writes(self, file_db):
+        """Test queued writes get the error when the writer cannot start"""
+
+        def fail_to_open():
+            raise sqlite3.OperationalError("unable to open database file")
+
+        file_db._open_writer_connection = fail_to_open
+        results = await asyncio.wait_for(
+            asyncio.gather(
+                file_db.execute("CREATE TABLE t (x)"),
+                file_db.execute_many("INSERT INTO t VALUES (?)", [(1,)]),
+                return_exceptions=True,
+            ),
+            timeout=5,
+        )
+        assert all(isinstance(r, sqlite3.OperationalError) for r in results)
+
+        # The next write starts a fresh writer
+        del file_db._open_writer_connection
+        await file_db.execute("CREATE TABLE t (x)")
+        assert await file_db.get_table_info("t")
+
+    @pytest.mark.asyncio
+    async def test_fetch_all_dicts(self, file_db):
+        """Test dict fetches build plain dicts and leave pooled rows as Row"""
+        rows = await file_db.fetch_all_dicts("SELECT 1 AS a, 'x' AS b")
+        assert rows == [{"a": 1, "b": "x"}]
+        assert type(rows[0]) is dict
+
+        row = (await file_db.fetch_all("SELECT 1 AS a"))[0]
+        assert row["a"] == 1 and row[0] == 1
+
+    @pytest.mark.asyncio
+    async def test_connection_pragmas(self, file_db):
+        """Test new files get the tuned page size and connections the PRAGMAs"""
+        async with file_db.get_connection() as conn:
+            values = {}
+            for name in ("page_size", "journal_size_limit", "busy_timeout"):
+                rows = await conn.execute_fetchall(f"PRAGMA {name}")
+                values[name] = next(iter(rows))[0]
+        assert values == {
+            "page_size": 8192,
+            "journal_size_limit": 67108864,
+            "busy_timeout": 5000,
+        }
+
+    @pytest.mark.asyncio
+    async def test_journal_mode(self, file_db, tmp_path):
+        """Test WAL is the default and wal2 falls back to WAL where unsupported"""
+        assert file_db.journal_mode == "wal"
+
+        manager = SQLiteManager(str(tmp_path / "wal2.db"), wal2=True)
+        await manager.initialize()
+        try:
+            assert manager.journal_mode in ("wal2", "wal")
+        finally:
+            await manager.close()
+
+    @pytest.mark.asyncio
+    async def test_get_database_size(self, file_db, monkeypatch):
+        """Test size stats come from one query and are cached briefly"""
+        queries = []
+        fetch_one = file_db.fetch_one
+
+        async def record_query(query, parameters=()):
+            queries.append(query)
+            return await fetch_one(query, parameters)
+
+        monkeypatch.setattr(file_db, "fetch_one", record_query)
+
+        size = await file_db.get_database_size()
+        assert size["page_size_bytes"] == 8192
+        assert size["total_pages"] > 0
+        assert await file_db.get_database_size() == size
+        assert len(queries) == 1
+
+        file_db._size_cache = (float("-inf"), size)  # Expired
+        await file_db.get_database_size()
+        assert len(queries) == 2
+
+    @pytest.mark.asyncio
+    async def test_sync_connection_reused_per_thread(self, file_db):
+        """Test sync queries reuse one configured connection per thread"""
+        with file_db.sync_connection() as conn:
+            assert conn.execute("PRAGMA cache_size").fetchone()[0] == 10000
+        with file_db.sync_connection() as again:
+            assert again is conn
+
+        await asyncio.to_thread(file_db.execute_sync, "CREATE TABLE t (x)")
+        file_db.execute_sync("INSERT INTO t VALUES (1)")
+        row = file_db.execute_sync("SELECT count(*) AS n FROM t", fetch_one=True)
+        assert row["n"] == 1
+        assert len(file_db._sync_connections) == 2
+
+        await file_db.close()
+        assert file_db._sync_connections == []
+
+    @pytest.mark.asyncio
+    async def test_execute_returning(self, file_db):
+        """Test writes with RETURNING give back the row instead of lastrowid"""
+        await file_db.execute(
+            "CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT, created_at INTEGER DEFAULT 7)"
+        )
+        query = "INSERT INTO items (name) VALUES (?) RETURNING id, created_at"
+
+        row = await file_db.execute(query, ("a",))
+        assert (row["id"], row["created_at"]) == (1, 7)
+
+        # Grouped writes each get their own row
+        rows = await asyncio.gather(
+            file_db.execute(query, ("b",)),
+            file_db.execute("INSERT INTO items (name) VALUES (?)", ("c",)),
+            file_db.execute(query, ("d",)),
+        )
+        assert [rows[0]["id"], rows[1], rows[2]["id"]] == [2, 3, 4]
+
 
 class TestQuoteRepository:
     """Test quote repository operations"""
 
+    @pytest.mark.asyncio
+    async def test_record_quote_batches_inserts(
+        self, file_db, monkeypatch, sample_quote_data
+    ):
+        """Test buffered quotes are written in batches and visible to readers"""
+        from bot.db.repo import QuoteRepository
+
+        repo = QuoteRepository()
+        batches = []
+        execute_many = file_db.execute_many
+
+        async def record_batch(query, parameters_list):
+            batches.append(len(parameters_list))
+            await execute_many(query, parameters_list)
+
+        monkeypatch.setattr(file_db, "execute_many", record_batch)
+
+        for _ in range(repo.FLUSH_SIZE + 3):
+            await repo.record_quote(sample_quote_data)
+        assert batches == [repo.FLUSH_SIZE]
+
+        # The remainder is read back without waiting for the timer
+        quotes = await repo.get_recent_quotes("ADAUSDM", limit=1000)
+        assert len(quotes) == repo.FLUSH_SIZE + 3
+        assert batches == [repo.FLUSH_SIZE, 3]
+
+        # A lone quote is flushed by the timer
+        await repo.record_quote(sample_quote_data)
+        await asyncio.sleep(repo.FLUSH_INTERVAL * 4)
+        assert batches == [repo.FLUSH_SIZE, 3, 1]
+
+    @pytest.mark.asyncio
+    async def test_failed_quote_flush_keeps_quotes(
+        self, file_db, monkeypatch, sample_quote_data
+    ):
+        """Test quotes from a failed flush are kept and written by the next one"""
+        from bot.db.repo import QuoteRepository
+
+        repo = QuoteRepository()
+        execute_many = file_db.execute_many
+
+        async def fail_once(query, parameters_list):
+            monkeypatch.setattr(file_db, "execute_many", execute_many)
+            raise sqlite3.OperationalError("database is locked")
+
+        monkeypatch.setattr(file_db, "execute_many", fail_once)
+        await repo.record_quote(sample_quote_data)
+        with pytest.raises(sqlite3.OperationalError):
+            await repo.flush()
+
+        await repo.record_quote(sample_quote_data)
+        assert len(await repo.get_recent_quotes("ADAUSDM")) == 2
+
+    @pytest.mark.asyncio
+    async def test_sides_enabled_bitfield(self, file_db):
+        """Test sides are stored as a bitfield and legacy JSON still decodes"""
+        query = "INSERT INTO quotes (quote_id, timestamp, symbol_src, symbol_dst, source_bid_price, source_bid_qty, source_ask_price, source_ask_qty, total_spread_bps, sides_enabled) VALUES (?, 0, 'A', 'B', 1, 1, 1, 1, 8, ?)"
+
+        for i, sides in enumerate(([], ["bid"], ["ask"], ["bid", "ask"])):
+            await file_db.execute(query, (f"q{i}", encode_sides(sides)))
+        await file_db.execute(query, ("legacy", '["ask"]'))
+
+        rows = await file_db.fetch_all_dicts(
+            "SELECT sides_enabled FROM quotes ORDER BY id"
+        )
+        assert [int(row["sides_enabled"]) for row in rows[:4]] == [0, 1, 2, 3]
+        assert [decode_sides(row["sides_enabled"]) for row in rows] == [
+            [],
+            ["bid"],
+            ["ask"],
+            ["bid", "ask"],
+            ["ask"],
+        ]
+
     @pytest.mark.asyncio
     async def test_create_quote(self, test_db, sample_quote_data):
         """Test quote creation"""
@@ -184,7 +435,7 @@ class TestQuoteRepository:
             assert quote["symbol_src"] == "ADAUSDT"
             assert quote["symbol_dst"] == "ADAUSDM"
             assert quote["bid_price"] == 0.4495
-            assert json.loads(quote["sides_enabled"]) == ["bid", "ask"]
+            assert decode_sides(quote["sides_enabled"]) == ["bid", "ask"]
 
         finally:
             # Restore original db_manager
@@ -334,6 +585,72 @@ class TestOrderRepository:
         finally:
             bot.db.repo.db_manager = db_manager
 
+    @pytest.mark.asyncio
+    async def test_order_and_event_commit_together(self, file_db, sample_order_data):
+        """Test an order and its outbox event are written by one statement"""
+        await order_repo.create_order(sample_order_data)
+        events = await file_db.fetch_all_dicts("SELECT * FROM outbox")
+        assert [row["event_type"] for row in events] == ["order_created"]
+        assert int(events[0]["event_id"], 16) and len(events[0]["event_id"]) == 32
+        assert events[0]["aggregate_id"] == sample_order_data["order_id"]
+        payload = OutboxEventHandler.get_payload(events[0])
+        assert payload == {"quote_id": None, **sample_order_data}
+
+        # A rejected order leaves no event behind
+        with pytest.raises(sqlite3.IntegrityError):
+            await order_repo.create_order(sample_order_data)
+        assert len(await file_db.fetch_all("SELECT id FROM outbox")) == 1
+
+    @pytest.mark.asyncio
+    async def test_update_order_status_keeps_unset_fields(
+        self, file_db, sample_order_data
+    ):
+        """Test status updates only overwrite the fields that were given"""
+        order_id = sample_order_data["order_id"]
+
+        await order_repo.create_order(sample_order_data)
+        await order_repo.update_order_status(
+            order_id, "submitted", deltadefi_order_id="dd_1", tx_hash="tx_1"
+        )
+        await order_repo.update_order_status(order_id, "cancelled", tx_hash="")
+
+        order = await order_repo.get_order(order_id)
+        assert order["status"] == "cancelled"
+        assert order["deltadefi_order_id"] == "dd_1"
+        assert order["tx_hash"] == "tx_1"
+        assert order["error_message"] is None
+        assert order["submitted_at"] is not None
+
+        rows = await file_db.fetch_all_dicts(
+            "SELECT payload FROM outbox WHERE event_type = 'order_status_updated' ORDER BY created_at, rowid"
+        )
+        payloads = [OutboxEventHandler.get_payload(row) for row in rows]
+        assert payloads == [
+            {
+                "status": "submitted",
+                "deltadefi_order_id": "dd_1",
+                "tx_hash": "tx_1",
+            },
+            {"status": "cancelled", "tx_hash": ""},
+        ]
+
+    @pytest.mark.asyncio
+    async def test_active_orders_use_partial_index(self, file_db, sample_order_data):
+        """Test active order lookups by symbol read the active-orders index"""
+        for status in ("submitted", "filled", "cancelled"):
+            await order_repo.create_order(
+                {**sample_order_data, "order_id": status, "status": status}
+            )
+
+        active = await order_repo.get_active_orders(symbol="ADAUSDM")
+        assert [order["order_id"] for order in active] == ["submitted"]
+
+        plan = await file_db.fetch_all(
+            "EXPLAIN QUERY PLAN SELECT * FROM v_active_orders WHERE symbol = ?",
+            ("ADAUSDM",),
+        )
+        assert any("idx_orders_active" in row["detail"] for row in plan)
+
 
 class TestFillRepository:
     """Test fill repository operations"""
@@ -416,6 +733,21 @@ class TestPositionRepository:
         finally:
             bot.db.repo.db_manager = db_manager
 
+    @pytest.mark.asyncio
+    async def test_update_position_in_place(self, file_db):
+        """Test repeated updates keep the row and unset realized P&L"""
+        await position_repo.update_position("ADAUSDM", 100.0, 0.45)
+        first = await position_repo.get_position("ADAUSDM")
+        await position_repo.update_position("ADAUSDM", 50.0, 0.46, realized_pnl=2.5)
+        await position_repo.update_position("ADAUSDM", 75.0, 0.47)
+
+        position = await position_repo.get_position("ADAUSDM")
+        assert first["realized_pnl"] == 0
+        assert position["id"] == first["id"]
+        assert position["created_at"] == first["created_at"]
+        assert position["quantity"] == 75.0
+        assert position["realized_pnl"] == 2.5
+
     @pytest.mark.asyncio
     async def test_get_all_positions(self, test_db):
         """Test retrieving all positions"""
@@ -581,6 +913,59 @@ class TestOutboxRepository:
         finally:
             bot.db.repo.db_manager = db_manager
 
+    @pytest.mark.asyncio
+    async def test_claim_and_release_events(self, file_db):
+        """Test claiming a batch hides it from later claims until released"""
+        event_ids = [str(uuid.uuid4()) for _ in range(3)]
+        await file_db.execute_many(
+            "INSERT INTO outbox (event_id, event_type, aggregate_id, payload, created_at) VALUES (?, ?, ?, ?, ?)",
+            [
+                (event_id, "order_created", "order_1", "{}", 100 - i)
+                for i, event_id in enumerate(event_ids)
+            ],
+        )
+
+        claimed = await outbox_repo.claim_pending_events(limit=2)
+        assert [event["event_id"] for event in claimed] == event_ids[:0:-1]
+        assert all(event["status"] == "processing" for event in claimed)
+
+        remaining = await outbox_repo.claim_pending_events(limit=10)
+        assert [event["event_id"] for event in remaining] == event_ids[:1]
+
+        await outbox_repo.release_events([event["event_id"] for event in claimed])
+        released = await outbox_repo.claim_pending_events(limit=10)
+        assert len(released) == 2
+
+    @pytest.mark.asyncio
+    async def test_event_payload_round_trip(self, file_db):
+        """Test stored payloads, BLOB or TEXT, parse back to the original"""
+        payload = {"symbol": "ADAUSDM", "price": 0.45, "note": "caf\u00e9"}
+        await outbox_repo.add_event("order_created", "order_1", payload)
+        await file_db.execute(
+            "INSERT INTO outbox (event_id, event_type, aggregate_id, payload) VALUES (?, ?, ?, ?)",
+            ("legacy", "order_created", "order_2", json.dumps(payload)),
+        )
+
+        events = await outbox_repo.claim_pending_events(limit=10)
+        assert len(events) == 2
+        for event in events:
+            assert OutboxEventHandler.get_payload(event) == payload
+
+    @pytest.mark.asyncio
+    async def test_outbox_queries_use_indexes(self, file_db):
+        """Test polling and failure marking never scan the outbox table"""
+        queries = [
+            (OutboxRepository.PENDING_EVENTS_QUERY, (10,)),
+            (OutboxRepository.MARK_FAILED_QUERY, ("error", 60, "event_1")),
+            (OutboxRepository.MARK_FAILED_BATCH_QUERY, ('[["event_1", "error", 60]]',)),
+        ]
+
+        for query, params in queries:
+            plan = await file_db.fetch_all(f"EXPLAIN QUERY PLAN {query}", params)
+            details = [row["detail"] for row in plan]
+            assert not [d for d in details if d.startswith("SCAN outbox")]
+            assert any(d.startswith("SEARCH outbox USING") for d in details)
+
 
 class TestTradingSessionRepository:
     """Test trading session repository operations"""
@@ -692,6 +1077,164 @@ class TestOutboxWorker:
             bot.db.outbox_worker.db_manager = original_db
             bot.db.repo.db_manager = original_repo_db
 
+    @pytest.mark.asyncio
+    async def test_batch_records_outcomes(self, file_db):
+        """Test a batch persists completions and retries together"""
+        ok_id, bad_id = str(uuid.uuid4()), str(uuid.uuid4())
+        await file_db.execute_many(
+            "INSERT INTO outbox (event_id, event_type, aggregate_id, payload) VALUES (?, ?, ?, ?)",
+            [
+                (ok_id, "order_created", "order_1", '{"symbol": "ADAUSDM"}'),
+                (bad_id, "unknown_event", "order_2", "{}"),
+            ],
+        )
+
+        await OutboxWorker(batch_size=10)._process_batch()
+
+        ok = await file_db.fetch_one(
+            "SELECT * FROM outbox WHERE event_id = ?", (ok_id,)
+        )
+        bad = await file_db.fetch_one(
+            "SELECT * FROM outbox WHERE event_id = ?", (bad_id,)
+        )
+        assert ok["status"] == "completed"
+        assert bad["status"] == "failed"
+        assert bad["retry_count"] == 1
+        assert "No handler" in bad["error_message"]
+
+    @pytest.mark.asyncio
+    async def test_log_only_events_completed_on_claim(self, file_db):
+        """Test log-only events are completed by the claim and still logged"""
+        await file_db.execute_many(
+            "INSERT INTO outbox (event_id, event_type, aggregate_id, payload) VALUES (?, ?, ?, ?)",
+            [
+                ("created", "order_created", "order_1", "{}"),
+                ("filled", "order_filled", "order_1", "{}"),
+            ],
+        )
+
+        worker = OutboxWorker(batch_size=10)
+        logged = []
+
+        async def record_order_created(order_id, payload):
+            logged.append(order_id)
+
+        worker.handlers["order_"]._event_dispatch["order_created"] = (
+            record_order_created
+        )
+
+        claimed = await outbox_repo.claim_pending_events(10, worker._log_only_types)
+        assert {event["event_id"]: event["status"] for event in claimed} == {
+            "created": "completed",
+            "filled": "processing",
+        }
+        await outbox_repo.release_events(["filled"])
+        await file_db.execute(
+            "UPDATE outbox SET status = 'pending', processed_at = NULL"
+            " WHERE event_id = 'created'"
+        )
+
+        await worker._process_batch()
+
+        rows = await file_db.fetch_all("SELECT status, processed_at FROM outbox")
+        assert all(row["status"] == "completed" for row in rows)
+        assert all(row["processed_at"] for row in rows)
+        assert logged == ["order_1"]
+        assert worker.processed_count == 2
+
+    @pytest.mark.asyncio
+    async def test_retry_reuses_parsed_payload(self):
+        """Test a failed event's parsed payload is reused on its retry"""
+        worker = OutboxWorker()
+        handler = worker.handlers["order_"]
+        payloads = []
+
+        async def failing_order_created(order_id, payload):
+            payloads.append(payload)
+            raise RuntimeError("handler failed")
+
+        handler._event_dispatch["order_created"] = failing_order_created
+        failures = []
+        for _ in range(2):
+            event = {
+                "event_id": "event_1",
+                "event_type": "order_created",
+                "aggregate_id": "order_1",
+                "payload": '{"symbol": "ADAUSDM"}',
+                "retry_count": 0,
+            }
+            await worker._handle_event(event, [], failures)
+
+        assert len(failures) == 2
+        assert payloads[0] == {"symbol": "ADAUSDM"}
+        assert payloads[1] is payloads[0]
+
+    @pytest.mark.asyncio
+    async def test_cleanup_uses_wall_clock_cutoff(self, file_db, monkeypatch):
+        """Test cleanup compares processed_at against unix time"""
+        import bot.db.outbox_worker
+
+        monkeypatch.setattr(bot.db.outbox_worker, "db_manager", file_db)
+
+        now = time.time()
+        await file_db.execute_many(
+            "INSERT INTO outbox (event_id, event_type, aggregate_id, payload, status, processed_at) VALUES (?, ?, ?, ?, 'completed', ?)",
+            [
+                ("old_event", "order_created", "order_1", "{}", now - 2 * 3600),
+                ("new_event", "order_created", "order_2", "{}", now - 60),
+            ],
+        )
+
+        deleted = await OutboxMonitor().cleanup_completed_events(older_than_hours=1)
+
+        assert deleted == 1
+        rows = await file_db.fetch_all("SELECT event_id FROM outbox")
+        assert [row["event_id"] for row in rows] == ["new_event"]
+
+    @pytest.mark.asyncio
+    async def test_cleanup_deletes_in_chunks(self, file_db, monkeypatch):
+        """Test cleanup keeps deleting bounded chunks until none are left"""
+        import bot.db.outbox_worker
+
+        monkeypatch.setattr(bot.db.outbox_worker, "db_manager", file_db)
+        monkeypatch.setattr(bot.db.outbox_worker, "_CLEANUP_CHUNK_SIZE", 2)
+
+        await file_db.execute_many(
+            "INSERT INTO outbox (event_id, event_type, aggregate_id, payload, status, processed_at) VALUES (?, ?, ?, ?, 'completed', 1)",
+            [(f"event_{i}", "order_created", "order_1", "{}") for i in range(5)],
+        )
+
+        deleted = await OutboxMonitor().cleanup_completed_events(older_than_hours=1)
+
+        assert deleted == 5
+        assert await file_db.fetch_all("SELECT event_id FROM outbox") == []
+
+    @pytest.mark.asyncio
+    async def test_order_handler_dispatch(self):
+        """Test order events and status updates route through the method tables"""
+        handler = OutboxWorker().handlers["order_"]
+        calls = []
+
+        async def record(order_id, payload):
+            calls.append((order_id, payload["status"]))
+
+        handler._status_dispatch["rejected"] = record
+        event = {
+            "event_id": "event_1",
+            "event_type": "order_status_updated",
+            "aggregate_id": "order_1",
+            "payload": '{"status": "rejected"}',
+        }
+        await handler.handle(event)
+        await handler.handle({**event, "event_type": "order_unknown"})
+
+        assert calls == [("order_1", "rejected")]
+        assert handler.event_types == (
+            "order_created",
+            "order_status_updated",
+            "order_filled",
+        )
+
 
 class TestDatabaseIntegration:
     """Integration tests for database components"""